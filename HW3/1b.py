@@ -1,9 +1,15 @@
+import os
+import sys
 import numpy as np
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer
+from qiskit import QuantumCircuit
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
 import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import execution
+
+
 def quantum_repetition_code():
     qc = QuantumCircuit(5, 5)
     
@@ -38,8 +44,8 @@ def quantum_repetition_code():
     
     print(qc.draw())
  
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(qc, simulator)
+    simulator = execution.get_backend('qasm_simulator')
+    compiled_circuit = execution.transpile(qc, simulator)
  
     job = simulator.run(compiled_circuit, shots=100)
     result = job.result()
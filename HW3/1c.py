@@ -1,9 +1,12 @@
+import os
+import sys
 import numpy as np
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer
+from qiskit import QuantumCircuit
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
-from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import execution, repetition
 def quantum_repetition_code_multiple_rounds(num_rounds=10):
     qc = QuantumCircuit(5, 3 + 2*num_rounds)
     apply_x = np.random.random() < 0.5
@@ -28,48 +31,27 @@ def quantum_repetition_code_multiple_rounds(num_rounds=10):
     qc.measure(0, 0)
     qc.measure(1, 1)
     qc.measure(2, 2)
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(qc, simulator)
-    job = simulator.run(compiled_circuit, shots=100)
+    simulator = execution.get_backend('qasm_simulator')
+    compiled_circuit = execution.transpile(qc, simulator)
+    job = simulator.run(compiled_circuit, shots=100, memory=True)
     result = job.result()
-    counts = result.get_counts(compiled_circuit)
+    memory = result.get_memory(compiled_circuit)
     
-    return counts
+    return memory
 
-def analyze_results(counts):
-    all_syndromes = []
-    data_results = {}
-    
-    for outcome, count in counts.items():
-        
-        data_bits = outcome[:3] 
-        
-        syndromes = []
-        for i in range(10):  # 10 rounds
-            start_idx = 3 + 2*i
-            if start_idx + 1 < len(outcome):
-                syndrome = outcome[start_idx:start_idx+2]
-                syndromes.append(syndrome)
-        
-        # Count how many times each syndrome appears
-        syndrome_counter = Counter(syndromes)
-        most_common_syndrome = syndrome_counter.most_common(1)[0][0]
-        all_syndromes.append((most_common_syndrome, count))
-        if data_bits in data_results:
-            data_results[data_bits] += count
-        else:
-            data_results[data_bits] = count
-    syndrome_counts = {}
-    for syndrome, count in all_syndromes:
-        if syndrome in syndrome_counts:
-            syndrome_counts[syndrome] += count
-        else:
-            syndrome_counts[syndrome] = count
-    
-    return data_results, syndrome_counts
+def analyze_results(memory, num_rounds=10):
+    """Per-shot syndromes are sliced into a (shots, rounds, checks) array, the
+    data bits are decoded and the logical error rate is reported."""
+    # The ancillas start in |+>, so the syndromes are random and carry no
+    # parity information; the logical value is a majority vote of the data
+    analysis = repetition.analyze_memory(memory, num_rounds, distance=3, use_syndromes=False)
+    print(f"Detection event rate per round: {np.round(analysis['detection_rate'], 3)}")
+    print(f"Logical error rate (majority vote of the data): {analysis['logical_error_rate']:.3f}")
+    return analysis['data_counts'], analysis['syndrome_counts']
 
-counts = quantum_repetition_code_multiple_rounds(num_rounds=10)
-data_results, syndrome_counts = analyze_results(counts)
+num_rounds = 10
+memory = quantum_repetition_code_multiple_rounds(num_rounds=num_rounds)
+data_results, syndrome_counts = analyze_results(memory, num_rounds)
 print("Data qubit measurements:", data_results)
 print("Most common syndrome measurements:", syndrome_counts)
 plt.figure(figsize=(12, 5))
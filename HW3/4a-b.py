@@ -1,6 +1,10 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
-from math import ceil, floor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import resources, threshold
 
 
 A = 1  
@@ -8,17 +12,17 @@ c = 2
 
 def calculate_logical_error_rate(d, p, pth):
     """Calculate logical error rate based on code distance, physical error rate, and threshold."""
-    pL = A * (p / pth) ** ((d + 1) / 2)
+    pL = resources.logical_error_rate(d, p, pth, A)
     return pL
 
 def calculate_physical_qubits(d):
     """Calculate the number of physical qubits needed for a logical qubit."""
-    Nq = c * (d ** 2)
+    Nq = resources.physical_qubits(d, c)
     return Nq
 
 def calculate_correctable_errors(d):
     """Calculate the number of errors that can be corrected based on code distance."""
-    return floor((d - 1) / 2)
+    return resources.correctable_errors(d)
 
 def analyze_logical_error_rate_behavior():
     """Analyze how logical error rate behaves as code distance approaches infinity."""
@@ -29,8 +33,7 @@ def analyze_logical_error_rate_behavior():
     p_above_threshold = 1e-1  
     pth = 1e-2                
     
-    pL_below = [calculate_logical_error_rate(d, p_below_threshold, pth) for d in distances]
-    pL_above = [calculate_logical_error_rate(d, p_above_threshold, pth) for d in distances]
+    pL_below, pL_above = resources.distance_sweep(distances, [p_below_threshold, p_above_threshold], pth, A)
     
     plt.figure(figsize=(12, 8))
     
@@ -66,7 +69,7 @@ def analyze_logical_error_rate_behavior():
     return distances, pL_below, pL_above
 
 
-def calculate_requirements_for_applications():
+def calculate_requirements_for_applications(A=A, pth_values=(1e-2, 1e-3)):
     """Calculate the required resources for different quantum applications."""
     
     applications = {
@@ -76,56 +79,38 @@ def calculate_requirements_for_applications():
     }
     
     p_values = [1e-3, 1e-4]  
-    pth_values = [1e-2, 1e-3]  
+    pth_values = list(pth_values)
     
     print("\nResource Requirements for Different Applications (Part b):")
     print("=" * 105)
     print(f"{'Application':<30} {'p':<8} {'pth':<8} {'d':<6} {'Nq':<8} {'Errors Corrected':<16} {'pL':<10}")
     print("-" * 105)
     
-    for app_name, pL_target in applications.items():
-        for p in p_values:
-            for pth in pth_values:
-                if p < pth:
-                    
-                    
-                    log_term = np.log(pL_target / A) / np.log(p / pth)
-                    d_min = 2 * log_term - 1
-                    
-                    d = max(3, 2 * ceil(d_min / 2) + 1)  # Round up to next odd number
-                    
-                    # Calculate other parameters
-                    Nq = calculate_physical_qubits(d)
-                    correctable_errors = calculate_correctable_errors(d)
-                    pL = calculate_logical_error_rate(d, p, pth)
-                    
-                    # Print results
-                    print(f"{app_name:<30} {p:<8.0e} {pth:<8.0e} {d:<6d} {Nq:<8d} {correctable_errors:<16d} {pL:<10.2e}")
-                else:
-                    # Error correction doesn't work when p >= pth
-                    print(f"{app_name:<30} {p:<8.0e} {pth:<8.0e} {'N/A':<6} {'N/A':<8} {'N/A':<16} {'N/A':<10}")
+    # One broadcast evaluation over every (application, p, pth) combination
+    table = resources.estimate(list(applications.values()), p_values, pth_values, A=A, c=c)
+    app_names = list(applications.keys())
+    rows_per_app = len(p_values) * len(pth_values)
+    row_apps = np.repeat(app_names, rows_per_app)
+    
+    for i, app_name in enumerate(row_apps):
+        p, pth = table['p'][i], table['pth'][i]
+        if table['feasible'][i]:
+            d = int(table['d'][i])
+            Nq = int(table['Nq'][i])
+            correctable_errors = int(table['correctable'][i])
+            pL = table['pL'][i]
+            print(f"{app_name:<30} {p:<8.0e} {pth:<8.0e} {d:<6d} {Nq:<8d} {correctable_errors:<16d} {pL:<10.2e}")
+        else:
+            # Error correction doesn't work when p >= pth
+            print(f"{app_name:<30} {p:<8.0e} {pth:<8.0e} {'N/A':<6} {'N/A':<8} {'N/A':<16} {'N/A':<10}")
     
     print("-" * 105)
     
-    
-    app_names = list(applications.keys())
-    scenario_names = []
-    qubit_counts = []
-    distances = []
-    
-    for app_name, pL_target in applications.items():
-        for p in p_values:
-            for pth in pth_values:
-                if p < pth:
-                    log_term = np.log(pL_target / A) / np.log(p / pth)
-                    d_min = 2 * log_term - 1
-                    d = max(3, 2 * ceil(d_min / 2) + 1)
-                    Nq = calculate_physical_qubits(d)
-                    
-                    scenario = f"p={p:.0e}, pth={pth:.0e}"
-                    scenario_names.append(scenario)
-                    qubit_counts.append(Nq)
-                    distances.append(d)
+    feasible = table['feasible']
+    scenario_names = [f"p={p:.0e}, pth={pth:.0e}" for p, pth in zip(table['p'][feasible], table['pth'][feasible])]
+    qubit_counts = table['Nq'][feasible]
+    distances = table['d'][feasible]
+    scenario_app = row_apps[feasible]
     
     plt.figure(figsize=(15, 10))
     
@@ -133,13 +118,9 @@ def calculate_requirements_for_applications():
     x = np.arange(len(scenario_names))
     width = 0.25
     
-    scenario_per_app = 4  
-    
-    for i in range(len(app_names)):
-        start_idx = i * scenario_per_app
-        end_idx = start_idx + scenario_per_app
-        plt.bar(x[start_idx:end_idx], qubit_counts[start_idx:end_idx], width, 
-                label=app_names[i])
+    for app_name in app_names:
+        mask = scenario_app == app_name
+        plt.bar(x[mask], qubit_counts[mask], width, label=app_name)
     
     plt.ylabel('Physical Qubits Required (Nq)', fontsize=14)
     plt.title('Physical Qubit Requirements by Application and Error Rates', fontsize=16)
@@ -150,11 +131,9 @@ def calculate_requirements_for_applications():
     
     plt.subplot(2, 1, 2)
     
-    for i in range(len(app_names)):
-        start_idx = i * scenario_per_app
-        end_idx = start_idx + scenario_per_app
-        plt.bar(x[start_idx:end_idx], distances[start_idx:end_idx], width, 
-                label=app_names[i])
+    for app_name in app_names:
+        mask = scenario_app == app_name
+        plt.bar(x[mask], distances[mask], width, label=app_name)
     
     plt.ylabel('Code Distance (d)', fontsize=14)
     plt.title('Required Code Distance by Application and Error Rates', fontsize=16)
@@ -177,6 +156,13 @@ if __name__ == "__main__":
     distances, pL_below, pL_above = analyze_logical_error_rate_behavior()
     
     # Part (b)
-    calculate_requirements_for_applications()
+    if "--fit" in sys.argv:
+        # Replace the assumed A = 1, pth = 1e-2 with values fitted to
+        # repetition-code Monte Carlo data
+        A_fit, pth_fit = threshold.estimate_parameters()
+        print(f"\nFitted threshold model: A = {A_fit:.3f}, pth = {pth_fit:.3e}")
+        calculate_requirements_for_applications(A=A_fit, pth_values=[pth_fit])
+    else:
+        calculate_requirements_for_applications()
     
     print("\nPlots have been saved as 'logical_error_rate_behavior.png' and 'application_requirements.png'")
\ No newline at end of file
@@ -1,12 +1,15 @@
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer  
-from qiskit import QuantumCircuit, transpile
+import os
+import sys
+from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit
 from qiskit.visualization import plot_histogram
-from qiskit.primitives import Sampler
 import numpy as np
 import matplotlib.pyplot as plt
 from math import gcd
-from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import execution, shor
+from csci769.period import estimate_period
 
 
 N = 15  
@@ -15,6 +18,11 @@ a = 2
 n_count = 8  
 n_input = 4 
 
+# Semiclassical mode recycles one control qubit, so its width is n_input + 1
+# and the counting precision is not limited by memory
+semiclassical = '--semiclassical' in sys.argv
+n_count_semiclassical = 16
+
 def qft_dagger(circuit, n):
     for qubit in range(n//2):
         circuit.swap(qubit, n-qubit-1)
@@ -24,15 +32,6 @@ def qft_dagger(circuit, n):
         circuit.h(j)
     return circuit
 
-def c_amod15(a, power):
-    U = QuantumCircuit(4)
-    for iteration in range(power):
-        if a == 2:
-            U.swap(0, 1)
-            U.swap(1, 2)
-            U.swap(2, 3)
-    return U
-
 def create_shor_circuit():
     qc = QuantumCircuit(n_count + n_input, n_count)
     
@@ -41,10 +40,9 @@ def create_shor_circuit():
     
     qc.x(n_count)
     
-    for q in range(n_count):
-        power = 2 ** q
-        controlled_U = c_amod15(a, power).control(1)
-        qc.append(controlled_U, [q] + list(range(n_count, n_count + n_input)))
+    # Controlled multiply by a^(2^q) mod N, with 2^q reduced mod the order
+    # of a and the synthesized blocks cached
+    shor.append_modexp(qc, a, N, range(n_count), range(n_count, n_count + n_input))
     
     qft_dagger(qc, n_count)
     
@@ -52,46 +50,36 @@ def create_shor_circuit():
     
     return qc
 
-def find_period_and_factors():
+def find_period_and_factors(semiclassical=False):
    
-    shor_circuit = create_shor_circuit()
-    
-    simulator = Aer.get_backend('aer_simulator')
-    compiled_circuit = transpile(shor_circuit, simulator)
+    simulator = execution.get_backend('aer_simulator')
+    if semiclassical:
+        precision = n_count_semiclassical
+        shor_circuit = shor.semiclassical_circuit(a, N, precision, n_input)
+    else:
+        precision = n_count
+        shor_circuit = create_shor_circuit()
     
-    sampler = Sampler()
-    job = sampler.run(compiled_circuit, shots=1024)
-    result = job.result()
-    counts = result.quasi_dists[0]
-    formatted_counts = {}
-    for key, value in counts.items():
-        binary_key = format(key, f'0{n_count}b')
-        formatted_counts[binary_key] = value
-    measured_phases = []
-    for output, count in formatted_counts.items():
-        decimal = int(output, 2)
-        phase = decimal/(2**n_count)
-        measured_phases.append((phase, count))
-    measured_phases.sort(key=lambda x: x[1], reverse=True)
+    # Sample in small batches, combining the continued-fraction denominators
+    # of all shots so far, and stop as soon as the period is confirmed
+    estimate = estimate_period(a, N, shor_circuit, precision, simulator, batch=8,
+                               max_shots=1024, seed=0)
+    r = estimate['period']
+    print(f"Period confirmed after {estimate['shots']} shots "
+          f"(confidence {estimate['confidence']:.2f})")
     
-    for phase, count in measured_phases:
-        if phase != 0:  
-            frac = Fraction(phase).limit_denominator(N)
-            r = frac.denominator
-            if pow(a, r, N) == 1:
-                # factors
-                if r % 2 == 0:
-                    a_r_div_2 = pow(a, r // 2, N)
-                    factor1 = gcd(a_r_div_2 + 1, N)
-                    factor2 = gcd(a_r_div_2 - 1, N)
-                    
-                    if factor1 != 1 and factor1 != N:
-                        return r, factor1, factor2
+    if r is not None and r % 2 == 0:
+        a_r_div_2 = pow(a, r // 2, N)
+        factor1 = gcd(a_r_div_2 + 1, N)
+        factor2 = gcd(a_r_div_2 - 1, N)
+        
+        if factor1 != 1 and factor1 != N:
+            return r, factor1, factor2
     
     return None, None, None
 
 
-period, factor1, factor2 = find_period_and_factors()
+period, factor1, factor2 = find_period_and_factors(semiclassical)
 
 print(f"For N = {N} and a = {2}:")
 print(f"Period found: r = {period}")
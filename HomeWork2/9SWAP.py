@@ -1,6 +1,10 @@
 #Implementing the SWAP Gate in Qiskit (10 pts)
+import os
+import sys
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import reversible
 
 def run_swap_circuit(initial_state):
     qc = QuantumCircuit(2)
@@ -15,9 +19,8 @@ def run_swap_circuit(initial_state):
     qc.cx(1, 0)
     qc.cx(0, 1)
     
-    # Simulate 
-    state = Statevector.from_instruction(qc)
-    probabilities = state.probabilities_dict()
+    # Simulate on bits: the circuit only contains X and CX gates
+    probabilities = reversible.probabilities_dict(qc)
     
     return probabilities
 
@@ -1,7 +1,11 @@
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+import os
+import sys
+from qiskit import QuantumCircuit
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csci769 import execution
+
 
 def create_toffoli_circuit(initial_state):
     
@@ -39,7 +43,7 @@ def create_toffoli_circuit(initial_state):
     return qc
 
 
-simulator = AerSimulator()
+simulator = execution.get_backend()
 basis_states = ['000', '001', '010', '011', '100', '101', '110', '111']
 results = {}
 
@@ -48,7 +52,7 @@ print("----------------------------------------------")
 
 for state in basis_states:
     circuit = create_toffoli_circuit(state)
-    compiled_circuit = transpile(circuit, simulator)
+    compiled_circuit = execution.transpile(circuit, simulator)
     
     # Run the circuit on the simulator
     job = simulator.run(compiled_circuit, shots=1000)
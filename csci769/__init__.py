@@ -0,0 +1 @@
+"""Shared simulation helpers for the CSCI-769 homework scripts."""
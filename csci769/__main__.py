@@ -0,0 +1,5 @@
+import sys
+
+from csci769.cli import main
+
+sys.exit(main())
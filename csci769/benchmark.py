@@ -0,0 +1,325 @@
+"""Stage-level benchmarks of every algorithm in the repo, with regression tracking.
+
+Each workload is split into the same four stages:
+
+    build        construct the circuit
+    transpile    compile it for the simulator (transpilation cache cleared first)
+    simulate     run it on Aer
+    postprocess  turn the counts into the quantity the homework reports
+
+and is timed across a grid of scaling parameters. The circuits are the
+ones the homework runs: they come from `csci769.experiments` and the
+library modules, not from copies kept here. A point is run `repeat` times
+and the fastest time of every stage is kept. One extra run under
+tracemalloc records the peak Python heap of every stage; memory held by
+Aer itself is not seen by tracemalloc. Gate counts, width and depth are
+taken from the transpiled circuit.
+
+Every invocation appends one entry to a JSON history file and compares
+each point with the most recent earlier entry that has it. A stage that
+got slower by more than `threshold` (and by more than `min_seconds`), or
+a transpiled circuit that gained gates, is reported as a regression.
+
+Example:
+    python -m csci769.benchmark --workloads grover qpe --threshold 0.25
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from qiskit import QuantumCircuit, __version__ as qiskit_version
+from qiskit_aer import __version__ as aer_version
+
+from csci769 import execution, grover, mcx, period, shor
+from csci769.experiments import grover as grover_experiment
+from csci769.experiments import qpe as qpe_experiment
+from csci769.experiments import steane as steane_experiment
+
+STAGES = ['build', 'transpile', 'simulate', 'postprocess']
+
+
+def mcx_circuit(n_controls):
+    """Multi-controlled X from `csci769.mcx` (the HomeWork2 Toffoli for 2 controls) on |1...1>."""
+    qc = QuantumCircuit(n_controls + 1, n_controls + 1)
+    qc.x(range(n_controls))
+    mcx.apply_mcx(qc, list(range(n_controls)), n_controls)
+    qc.measure(range(n_controls + 1), range(n_controls + 1))
+    return qc
+
+
+def mcx_postprocess(counts, n_controls, shots):
+    """Fraction of shots with the target flipped."""
+    return counts.get('1' * (n_controls + 1), 0) / shots
+
+
+def steane_circuit(apply_x, apply_z):
+    """HW3/3 Steane code circuit with the given errors injected on qubit 1."""
+    # steane_code_circuit reports the injected errors on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        qc, _, _ = steane_experiment.steane_code_circuit(apply_x, apply_z)
+    return qc
+
+
+def steane_postprocess(counts, apply_x, apply_z, shots):
+    """Number of distinct data states, tallied with the HW3/3 analysis."""
+    data_states, _, _ = steane_experiment.analyze_results(counts)
+    return len(data_states)
+
+
+def grover_circuit(n):
+    """HW4/2 Grover search for |0...0> with the optimal number of iterations."""
+    return grover_experiment.build_grover_circuit(grover_experiment.create_oracle_min,
+                                                  grover.optimal_iterations(n), n)
+
+
+def grover_postprocess(counts, n, shots):
+    """Probability of measuring the marked state."""
+    return counts.get('0' * n, 0) / shots
+
+
+def qpe_circuit(n_count):
+    """HW4/3 phase estimation, of P(2 pi / 3) so the phase is not exactly representable."""
+    return qpe_experiment.create_qpe_circuit(n_count, 1, 2 * np.pi / 3)
+
+
+def qpe_postprocess(counts, n_count, shots):
+    """Phase estimate from the most frequent outcome."""
+    best = max(counts, key=counts.get)
+    return 2 * np.pi * int(best, 2) / 2 ** n_count
+
+
+def shor_circuit(N, a, n_count):
+    """Semiclassical order finding for a mod N, as run by `csci769.factoring`."""
+    return shor.semiclassical_circuit(a, N, n_count)
+
+
+def shor_postprocess(counts, N, a, n_count, shots):
+    """Period of a mod N from the continued fractions of all samples."""
+    samples = np.repeat([int(key, 2) for key in counts], list(counts.values()))
+    r, _ = period.combine(a, N, period.convergent_denominators(samples, n_count, N))
+    return r
+
+
+# name: (build, postprocess, full grid, quick grid)
+WORKLOADS = {
+    'mcx': (mcx_circuit, mcx_postprocess,
+            [{'n_controls': n, 'shots': 1000} for n in (2, 4, 8, 12)],
+            [{'n_controls': 2, 'shots': 1000}]),
+    'steane': (steane_circuit, steane_postprocess,
+               [{'apply_x': x, 'apply_z': z, 'shots': s}
+                for x, z in ((False, False), (True, True)) for s in (1000, 100000)],
+               [{'apply_x': False, 'apply_z': False, 'shots': 1000}]),
+    'grover': (grover_circuit, grover_postprocess,
+               [{'n': n, 'shots': 1000} for n in (3, 5, 7, 9)],
+               [{'n': 3, 'shots': 1000}]),
+    'qpe': (qpe_circuit, qpe_postprocess,
+            [{'n_count': n, 'shots': 1000} for n in (3, 6, 9, 12)],
+            [{'n_count': 3, 'shots': 1000}]),
+    'shor': (shor_circuit, shor_postprocess,
+             [{'N': 15, 'a': 7, 'n_count': 8, 'shots': 1000},
+              {'N': 21, 'a': 2, 'n_count': 10, 'shots': 1000},
+              {'N': 35, 'a': 3, 'n_count': 12, 'shots': 1000}],
+             [{'N': 15, 'a': 7, 'n_count': 8, 'shots': 1000}]),
+}
+
+
+def point_key(workload, params):
+    """Identifier of one (workload, parameters) point across history entries."""
+    return workload + ':' + ','.join(f'{k}={params[k]}' for k in sorted(params))
+
+
+def _run_stages(build, postprocess, params, backend, seed, heap=None):
+    """Time the four stages; with a `heap` dict, also record each stage's peak traced heap."""
+    build_params = {k: v for k, v in params.items() if k != 'shots'}
+    times = {}
+
+    @contextlib.contextmanager
+    def stage(name):
+        if heap is not None:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        yield
+        times[name] = time.perf_counter() - start
+        if heap is not None:
+            heap[name] = tracemalloc.get_traced_memory()[1]
+
+    with stage('build'):
+        qc = build(**build_params)
+
+    execution.clear_cache()
+    with stage('transpile'):
+        compiled = execution.transpile(qc, backend)
+
+    with stage('simulate'):
+        counts = backend.run(compiled, shots=params['shots'],
+                             seed_simulator=seed).result().get_counts()
+
+    with stage('postprocess'):
+        value = postprocess(counts, **params)
+    return times, compiled, value
+
+
+def run_point(workload, params, repeat=3, seed=0, backend=None):
+    """Best-of-`repeat` stage times, per-stage heap peaks and gate counts of one point."""
+    build, postprocess = WORKLOADS[workload][:2]
+    if backend is None:
+        backend = execution.get_backend()
+    best = dict.fromkeys(STAGES, float('inf'))
+    for _ in range(repeat):
+        times, compiled, value = _run_stages(build, postprocess, params, backend, seed)
+        for stage in STAGES:
+            best[stage] = min(best[stage], times[stage])
+
+    heap = {}
+    tracemalloc.start()
+    try:
+        _run_stages(build, postprocess, params, backend, seed, heap)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'workload': workload,
+        'params': params,
+        'key': point_key(workload, params),
+        'seconds': best,
+        'total_seconds': sum(best.values()),
+        'peak_python_bytes': heap,
+        'width': compiled.num_qubits,
+        'depth': compiled.depth(),
+        'size': compiled.size(),
+        'gates': dict(compiled.count_ops()),
+        'result': value if value is None else float(value),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                              timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_suite(workloads=None, quick=False, repeat=3, seed=0):
+    """One history entry with a result for every point of the selected workloads."""
+    results = []
+    for name in workloads or list(WORKLOADS):
+        grid = WORKLOADS[name][3 if quick else 2]
+        for params in grid:
+            results.append(run_point(name, params, repeat, seed))
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'qiskit': qiskit_version,
+        'qiskit_aer': aer_version,
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(path, history):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, path)
+
+
+def find_regressions(entry, history, threshold=0.2, min_seconds=1e-3):
+    """Stages and gate counts of `entry` that got worse than in `history`.
+
+    Each point is compared with the latest history entry containing it.
+    Returns a list of dicts with key, metric, baseline, current and the
+    relative change.
+    """
+    baselines = {}
+    for previous in history:
+        for result in previous['results']:
+            baselines[result['key']] = result
+    regressions = []
+    for result in entry['results']:
+        baseline = baselines.get(result['key'])
+        if baseline is None:
+            continue
+        for stage in STAGES:
+            old, new = baseline['seconds'][stage], result['seconds'][stage]
+            if new - old > min_seconds and new > old * (1 + threshold):
+                regressions.append({'key': result['key'], 'metric': stage, 'baseline': old,
+                                    'current': new, 'change': new / old - 1 if old else float('inf')})
+        if result['size'] > baseline['size']:
+            regressions.append({'key': result['key'], 'metric': 'size', 'baseline': baseline['size'],
+                                'current': result['size'],
+                                'change': result['size'] / baseline['size'] - 1})
+    return regressions
+
+
+def _format_bytes(n):
+    return f'{n / 2**20:.1f}M'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--workloads', nargs='*', choices=list(WORKLOADS),
+                        help='workloads to run (default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help='smallest point of every workload only')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--history', default='benchmark_history.json')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown reported as a regression')
+    parser.add_argument('--min-seconds', type=float, default=1e-3,
+                        help='ignore slowdowns smaller than this')
+    parser.add_argument('--no-save', action='store_true',
+                        help='compare with the history without appending to it')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with status 1 if a regression is found')
+    args = parser.parse_args(argv)
+
+    entry = run_suite(args.workloads, args.quick, args.repeat, args.seed)
+    print(f"{'point':<48}" + ''.join(f'{stage:>12}' for stage in STAGES)
+          + f"{'width':>7}{'depth':>8}{'size':>8}{'heap':>9}")
+    print('-' * 128)
+    for result in entry['results']:
+        print(f"{result['key']:<48}"
+              + ''.join(f"{result['seconds'][stage] * 1e3:>10.2f}ms" for stage in STAGES)
+              + f"{result['width']:>7}{result['depth']:>8}{result['size']:>8}"
+              f"{_format_bytes(max(result['peak_python_bytes'].values())):>9}")
+
+    history = load_history(args.history)
+    regressions = find_regressions(entry, history, args.threshold, args.min_seconds)
+    if not history:
+        print(f"\nNo earlier runs in {args.history}")
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for r in regressions:
+            print(f"  {r['key']} {r['metric']}: {r['baseline']:.4g} -> {r['current']:.4g} "
+                  f"(+{r['change']:.0%})")
+    else:
+        print(f"\nNo regressions above {args.threshold:.0%} against {args.history}")
+
+    if not args.no_save:
+        save_history(args.history, history + [entry])
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Command-line entry point for the homework experiments and tools.
+
+    python -m csci769 list
+    python -m csci769 run grover --n 8
+    python -m csci769 --trace trace.json run qpe --n-count 5
+    python -m csci769 benchmark --quick
+
+The experiment options are declared here rather than in the experiment
+modules, so building the parser and printing help import nothing but
+argparse. An experiment module, and with it qiskit, is imported only when
+that experiment runs.
+"""
+import argparse
+import importlib
+import math
+import sys
+
+_NO_PLOT = (['--no-plot'], {'dest': 'plot', 'action': 'store_false',
+                            'help': 'skip the matplotlib figures'})
+
+# name: (module, description, [(flags, argparse options)]); every option's
+# dest is a keyword argument of the module's main()
+EXPERIMENTS = {
+    'text': ('csci769.experiments.text', 'q1: encode strings as X gates and decode them', [
+        (['--strings'], {'nargs': '+', 'default': ['RIT', 'QIS', 'GOS']}),
+        (['--shots'], {'type': int, 'default': 1000}),
+    ]),
+    'random-x': ('csci769.experiments.random_x', 'HW3/1a: randomly applied X gate', [
+        (['--trials'], {'type': int, 'default': 100}),
+        (['--seed'], {'type': int, 'default': None}),
+        _NO_PLOT,
+    ]),
+    'steane': ('csci769.experiments.steane', 'HW3/3: Steane code syndrome extraction', [
+        (['--shots'], {'type': int, 'default': 100}),
+        (['--frame-shots'], {'type': int, 'default': 10**7,
+                             'help': 'Pauli-frame shots per logical error rate'}),
+        _NO_PLOT,
+    ]),
+    'deutsch-jozsa': ('csci769.experiments.deutsch_jozsa',
+                      'HW4/1: Deutsch-Jozsa on small and random functions', [
+        (['--functions'], {'dest': 'num_functions', 'type': int, 'default': 10000}),
+        (['--inputs'], {'dest': 'n_inputs', 'type': int, 'default': 10}),
+        (['--seed'], {'type': int, 'default': 0}),
+    ]),
+    'grover': ('csci769.experiments.grover', 'HW4/2: Grover search for the minimum and maximum', [
+        (['--n'], {'type': int, 'default': 3, 'help': 'number of qubits'}),
+        (['--iterations'], {'dest': 'iterations_list', 'type': int, 'nargs': '+',
+                            'default': [2, 3, 8]}),
+        (['--shots'], {'type': int, 'default': 100}),
+        (['--seed'], {'type': int, 'default': 0}),
+        (['--large'], {'type': int, 'nargs': '*', 'default': [8, 16, 20],
+                       'help': 'qubit counts for the diagonal-oracle fast path'}),
+        _NO_PLOT,
+    ]),
+    'qpe': ('csci769.experiments.qpe', 'HW4/3: phase estimation and resolution curves', [
+        (['--n-count'], {'type': int, 'default': 3}),
+        (['--phase'], {'type': float, 'default': math.pi / 4}),
+        (['--sweep-counts'], {'type': int, 'nargs': '*', 'default': [3, 5]}),
+        (['--points'], {'type': int, 'default': 4096, 'help': 'phases per resolution curve'}),
+    ]),
+    'hhl': ('csci769.experiments.hhl', 'HW5/b1: HHL for the 1x1 system A x = b', [
+        (['--n-clock'], {'type': int, 'default': 3}),
+        (['--shots'], {'type': int, 'default': 4096}),
+        (['--points'], {'type': int, 'default': 1000, 'help': 'values of C in the sweep'}),
+    ]),
+}
+
+# name: (module, description); main(argv) of the module parses the rest
+TOOLS = {
+    'benchmark': ('csci769.benchmark', 'stage-level benchmarks with regression tracking'),
+    'sweep': ('csci769.sweep', 'repetition-code (distance, rounds, p) sweeps'),
+    'factor': ('csci769.factoring', "Shor factoring of general N"),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m csci769',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record stage spans and write a Chrome trace to FILE')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help='list the experiments')
+
+    run = commands.add_parser('run', help='run an experiment')
+    experiments = run.add_subparsers(dest='experiment', required=True, metavar='experiment')
+    for name, (_, description, options) in EXPERIMENTS.items():
+        sub = experiments.add_parser(name, help=description, description=description)
+        for flags, kwargs in options:
+            sub.add_argument(*flags, **kwargs)
+
+    for name, (_, description) in TOOLS.items():
+        commands.add_parser(name, help=description, add_help=False)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # Arguments after a tool name are left for the tool's own parser
+    args, rest = parser.parse_known_args(argv)
+    if rest and args.command not in TOOLS:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    if args.trace:
+        from csci769 import trace
+        trace.enable(args.trace)
+
+    if args.command == 'list':
+        for name, (_, description, _) in EXPERIMENTS.items():
+            print(f"{name:<16}{description}")
+        return
+    if args.command in TOOLS:
+        module = importlib.import_module(TOOLS[args.command][0])
+        sys.argv[0] = f'python -m csci769 {args.command}'  # usage line of the tool
+        return module.main(rest)
+
+    module = importlib.import_module(EXPERIMENTS[args.experiment][0])
+    options = {k: v for k, v in vars(args).items() if k not in ('command', 'experiment', 'trace')}
+    return module.main(**options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
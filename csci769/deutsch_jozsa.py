@@ -0,0 +1,110 @@
+"""Batched Deutsch-Jozsa classification of many Boolean functions.
+
+Oracles are given as truth tables, an array of shape (num_functions, 2^n)
+with entry [i, x] = f_i(x), or built from vectorized Python functions with
+`truth_tables`. Instead of one circuit and one sampler round trip per
+function, 2^m functions share one circuit: an m-qubit index register in
+uniform superposition selects the function, and the phase oracles of all
+of them are a single multiplexed diagonal (-1)^f_i(x) over index and input,
+one DiagonalGate, which Aer runs as its native 'diagonal' instruction.
+Starting from |0...0>, Hadamards on every qubit, the oracle and Hadamards
+on the inputs give
+
+    P(index = i, input = 0) = P_i(0) / 2^m,
+
+so the all-zeros probability of every function is read from one saved
+set of amplitudes. All chunks of 2^m functions go to the backend in one
+call. f_i is constant iff P_i(0) = 1 (balanced iff it is 0).
+
+Building the circuits dominates the run time: DiagonalGate validates every
+entry and append walks them again, about 1 s per 2^20 entries against
+0.3 s of simulation, so 10000 functions of 10 inputs take about 13 s.
+"""
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import DiagonalGate
+from qiskit_aer.library import SaveAmplitudesSquared
+
+from csci769 import execution
+
+
+def truth_tables(functions, n):
+    """Truth tables of vectorized functions f(x) -> bool on uint64 inputs."""
+    x = np.arange(2 ** n, dtype=np.uint64)
+    return np.array([np.broadcast_to(f(x), x.shape) for f in functions], dtype=np.uint8)
+
+
+def random_tables(num_functions, n, constant_fraction=0.5, seed=None):
+    """Random constant or balanced functions and a mask of the constant ones."""
+    rng = np.random.default_rng(seed)
+    constant = rng.random(num_functions) < constant_fraction
+    # A balanced function marks the half of the inputs with the lowest random keys
+    keys = rng.random((num_functions, 2 ** n))
+    tables = (np.argsort(np.argsort(keys, axis=1), axis=1) < 2 ** (n - 1)).astype(np.uint8)
+    tables[constant] = rng.integers(0, 2, size=(int(constant.sum()), 1), dtype=np.uint8)
+    return tables, constant
+
+
+def dj_circuit(table):
+    """Deutsch-Jozsa circuit for one truth table, with a phase oracle."""
+    table = np.asarray(table)
+    n = len(table).bit_length() - 1
+    qc = QuantumCircuit(n, n)
+    qc.h(range(n))
+    qc.append(DiagonalGate(list(1.0 - 2.0 * table)), range(n))
+    qc.h(range(n))
+    qc.measure(range(n), range(n))
+    return qc
+
+
+def _batch_circuit(tables, index_qubits):
+    n = tables.shape[1].bit_length() - 1
+    inputs = QuantumRegister(n, 'x')
+    index = QuantumRegister(index_qubits, 'index')
+    qc = QuantumCircuit(inputs, index)
+    qc.h(qc.qubits)
+    # Amplitude i 2^n + x picks up (-1)^f_i(x): the oracle of function i on
+    # the branch where the index register reads i
+    qc.append(DiagonalGate((1.0 - 2.0 * tables).ravel().tolist()), qc.qubits)
+    qc.h(inputs)
+    zeros = [i << n for i in range(2 ** index_qubits)]
+    qc.append(SaveAmplitudesSquared(qc.num_qubits, zeros, label='p0'), qc.qubits)
+    return qc
+
+
+def zero_probabilities(tables, backend=None, index_qubits=None):
+    """Probability of measuring all zeros for every function, in one backend call."""
+    tables = np.asarray(tables, dtype=np.uint8)
+    num_functions, size = tables.shape
+    n = size.bit_length() - 1
+    if size != 2 ** n:
+        raise ValueError("truth tables must have 2^n entries")
+    if backend is None:
+        backend = execution.get_backend(method='statevector')
+    if index_qubits is None:
+        # About 2^20 amplitudes per circuit
+        index_qubits = max(0, min(20 - n, (num_functions - 1).bit_length()))
+    per_circuit = 2 ** index_qubits
+
+    circuits = []
+    for start in range(0, num_functions, per_circuit):
+        chunk = tables[start:start + per_circuit]
+        if len(chunk) < per_circuit:
+            # Pad the last chunk with the constant-zero function
+            chunk = np.vstack([chunk, np.zeros((per_circuit - len(chunk), size), dtype=np.uint8)])
+        circuits.append(_batch_circuit(chunk, index_qubits))
+
+    result = backend.run(circuits, shots=1).result()
+    p0 = np.concatenate([np.asarray(result.data(i)['p0']) for i in range(len(circuits))])
+    return p0[:num_functions] * per_circuit
+
+
+def classify(tables, backend=None, index_qubits=None):
+    """True for the functions classified constant, False for balanced."""
+    return zero_probabilities(tables, backend, index_qubits) > 0.5
+
+
+def classify_classically(tables):
+    """Reference verdicts from the truth tables themselves."""
+    tables = np.asarray(tables)
+    return np.all(tables == tables[:, :1], axis=1)
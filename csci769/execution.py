@@ -0,0 +1,184 @@
+"""Shared backends and a process-wide transpilation cache.
+
+Backends are created once per (name, options) and kept alive. Transpiled
+circuits are cached under a structural hash of the circuit (its registers,
+every instruction's name, operands, parameters, condition and, for custom
+gates, definition) together with the backend (name, size and options) and
+the transpile options, so rebuilding a structurally identical circuit does
+not compile it again. Parameters are told apart by uuid, not by name.
+The cache is an LRU of `maxsize` entries; `cache_info` reports the hit
+rate and the compile time the hits saved.
+
+Cached transpiled circuits are shared between callers and must not be
+modified in place.
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit import transpile as qiskit_transpile
+from qiskit.circuit import ParameterExpression
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit_aer import Aer, AerSimulator
+from qiskit_aer.noise import NoiseModel
+
+from csci769 import trace
+
+_STANDARD = set(get_standard_gate_name_mapping()) | {'measure', 'reset', 'barrier', 'delay'}
+
+_backends = {}
+_cache = OrderedDict()
+_stats = {'hits': 0, 'misses': 0, 'compile_seconds': 0.0, 'saved_seconds': 0.0}
+maxsize = 256
+
+
+def get_backend(name='aer_simulator', **options):
+    """Shared backend instance for `name`, e.g. 'qasm_simulator' or 'aer_simulator'."""
+    key = (name, tuple(sorted(options.items())))
+    if key not in _backends:
+        if name == 'aer_simulator':
+            _backends[key] = AerSimulator(**options)
+        else:
+            backend = Aer.get_backend(name)
+            if options:
+                backend.set_options(**options)
+            _backends[key] = backend
+    return _backends[key]
+
+
+def _param_token(param):
+    if isinstance(param, ParameterExpression):
+        # Parameters are identified by uuid, not by name: two Parameter('phi')
+        # are different symbols, and a compiled circuit binds only its own
+        uuids = sorted(str(p.uuid) for p in param.parameters)
+        return 'P:' + str(param) + ':' + ','.join(uuids)
+    if isinstance(param, (int, float, complex, np.number)):
+        return repr(complex(param))
+    if isinstance(param, str):
+        return param
+    array = np.asarray(getattr(param, 'data', param))
+    if array.dtype != object:
+        return hashlib.sha1(np.ascontiguousarray(array).tobytes()).hexdigest() + str(array.shape)
+    return repr(param)
+
+
+def _update(h, qc):
+    h.update(f'{qc.num_qubits},{qc.num_clbits},{_param_token(qc.global_phase)}'.encode())
+    for register in qc.qregs + qc.cregs:
+        h.update(f'|{type(register).__name__}:{register.name}:{register.size}'.encode())
+    for instruction in qc.data:
+        op = instruction.operation
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        clbits = [qc.find_bit(c).index for c in instruction.clbits]
+        h.update(f';{op.name}:{qubits}:{clbits}'.encode())
+        for param in op.params:
+            if isinstance(param, QuantumCircuit):
+                _update(h, param)  # control-flow body
+            else:
+                h.update(_param_token(param).encode())
+        condition = getattr(op, 'condition', None)
+        if condition is not None:
+            target, value = condition
+            if hasattr(target, 'name') and hasattr(target, 'size'):
+                h.update(f'?{target.name}={value}'.encode())
+            else:
+                h.update(f'?{qc.find_bit(target).index}={value}'.encode())
+        if getattr(op, 'ctrl_state', None) is not None:
+            h.update(f'c{op.ctrl_state}'.encode())
+            op = op.base_gate
+            h.update(op.name.encode())
+        if op.name not in _STANDARD and type(op).__name__ not in ('UnitaryGate', 'DiagonalGate') \
+                and getattr(op, 'definition', None) is not None:
+            _update(h, op.definition)
+
+
+def structural_hash(qc):
+    """Hex digest that is equal for structurally identical circuits."""
+    h = hashlib.sha256()
+    _update(h, qc)
+    return h.hexdigest()
+
+
+def _without_ids(value):
+    if isinstance(value, dict):
+        return {k: _without_ids(v) for k, v in value.items() if k != 'id'}
+    if isinstance(value, list):
+        return [_without_ids(v) for v in value]
+    return value
+
+
+def _option_token(value):
+    """Text of a backend option that is stable across processes.
+
+    A NoiseModel's repr only lists its instructions, so it is described by
+    its serialized errors instead, without their random ids.
+    """
+    if isinstance(value, NoiseModel):
+        return json.dumps(_without_ids(value.to_dict(serializable=True)), sort_keys=True)
+    return repr(value)
+
+
+def _backend_key(backend):
+    options = getattr(backend, 'options', None)
+    options = tuple(sorted((k, _option_token(v)) for k, v in options.items())) if options else ()
+    return backend.name, getattr(backend, 'num_qubits', None), options
+
+
+def transpile(circuits, backend=None, optimization_level=None, **kwargs):
+    """`qiskit.transpile` through the structural cache.
+
+    Accepts one circuit or a list, like `qiskit.transpile`.
+    """
+    if backend is None:
+        backend = get_backend()
+    if not isinstance(circuits, (list, tuple)):
+        return _transpile_one(circuits, backend, optimization_level, kwargs)
+    return [_transpile_one(qc, backend, optimization_level, kwargs) for qc in circuits]
+
+
+def _transpile_one(qc, backend, optimization_level, kwargs):
+    key = (structural_hash(qc), _backend_key(backend), optimization_level,
+           tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    if key in _cache:
+        _cache.move_to_end(key)
+        compiled, seconds = _cache[key]
+        _stats['hits'] += 1
+        _stats['saved_seconds'] += seconds
+        trace.count('transpile.cache_hits')
+        return compiled
+
+    trace.count('transpile.cache_misses')
+    start = time.perf_counter()
+    with trace.span('transpile', backend=backend.name) as span:
+        compiled = span.circuit(qiskit_transpile(qc, backend, optimization_level=optimization_level,
+                                                 **kwargs))
+    seconds = time.perf_counter() - start
+    _stats['misses'] += 1
+    _stats['compile_seconds'] += seconds
+    _cache[key] = (compiled, seconds)
+    while len(_cache) > maxsize:
+        _cache.popitem(last=False)
+    return compiled
+
+
+def run(circuits, backend=None, optimization_level=None, **run_options):
+    """Transpile through the cache and run on the shared backend."""
+    if backend is None:
+        backend = get_backend()
+    compiled = transpile(circuits, backend, optimization_level)
+    return backend.run(compiled, **run_options)
+
+
+def cache_info():
+    """Hits, misses, hit rate, size and compile seconds spent and saved."""
+    lookups = _stats['hits'] + _stats['misses']
+    return dict(_stats, hit_rate=_stats['hits'] / lookups if lookups else 0.0,
+                size=len(_cache), maxsize=maxsize)
+
+
+def clear_cache():
+    _cache.clear()
+    _stats.update(hits=0, misses=0, compile_seconds=0.0, saved_seconds=0.0)
@@ -0,0 +1,10 @@
+"""Homework experiments as importable functions.
+
+Each module holds the circuits of one homework script and a `main` that
+runs the experiment. Importing a module runs nothing. The circuit
+builders need qiskit's QuantumCircuit, so importing a module imports
+qiskit; Aer, matplotlib and qiskit.visualization are deferred to the
+functions that need them. `python -m csci769 run <name>` is the
+command-line entry point, and `csci769.benchmark` times the circuits
+built here.
+"""
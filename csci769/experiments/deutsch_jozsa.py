@@ -0,0 +1,126 @@
+"""HW4/1: Deutsch-Jozsa for four small functions and thousands of random ones."""
+import time
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+
+def dj_f_x0_equals_0():
+    # For this function, we need 1 input qubit + 1 output qubit
+    qc = QuantumCircuit(2, 1)
+    
+    qc.x(1)
+    qc.h(0)
+    qc.h(1)
+    
+    qc.h(0)
+    
+    # Measure the input qubit
+    qc.measure(0, 0)
+    
+    return qc
+
+def dj_f_x0_xor_x1():
+    qc = QuantumCircuit(3, 2)
+
+    qc.x(2)
+    
+    qc.h(0)
+    qc.h(1)
+    qc.h(2)
+    
+    qc.cx(0, 2)
+    qc.cx(1, 2)
+    
+    qc.h(0)
+    qc.h(1)
+    
+    qc.measure([0, 1], [0, 1])
+    
+    return qc
+
+def dj_f_x0_equals_x0():
+    qc = QuantumCircuit(2, 1)
+    
+    qc.x(1)
+    
+    qc.h(0)
+    qc.h(1)
+  
+    qc.cx(0, 1)
+    
+    # Apply Hadamard to input qubit
+    qc.h(0)
+    
+    # Measure the input qubit
+    qc.measure(0, 0)
+    
+    return qc
+
+# 4. Function f(x₀, x₁) = 1 (Constant function)
+def dj_f_constant_1():
+    qc = QuantumCircuit(3, 2)
+    
+    qc.x(2)
+    
+    qc.h(0)
+    qc.h(1)
+    qc.h(2)
+    
+    qc.z(2)
+   
+    qc.h(0)
+    qc.h(1)
+    
+    # Measure the input qubits
+    qc.measure([0, 1], [0, 1])
+    
+    return qc
+
+# The same four functions as vectorized truth tables on x = x₀ + 2 x₁, so
+# they can be classified together in one batched simulator call
+functions = {
+    "f(x₀) = 0": lambda x: np.zeros_like(x),
+    "f(x₀, x₁) = x₀ ⊕ x₁": lambda x: (x ^ (x >> 1)) & 1,
+    "f(x₀) = x₀": lambda x: x & 1,
+    "f(x₀, x₁) = 1": lambda x: np.ones_like(x),
+}
+circuit_builders = [dj_f_x0_equals_0, dj_f_x0_xor_x1, dj_f_x0_equals_x0, dj_f_constant_1]
+
+
+def main(num_functions=10000, n_inputs=10, seed=0):
+    from csci769 import deutsch_jozsa, execution
+
+    print("Deutsch-Jozsa Algorithm Implementations")
+    print("======================================")
+
+    circuits = [build() for build in circuit_builders]
+    for name, qc in zip(functions, circuits):
+        print(f"\nCircuit for {name}:")
+        print(qc)
+
+    # The hand-written oracle circuits, simulated together in one call
+    shots = 1024
+    simulator = execution.get_backend()
+    result = simulator.run(execution.transpile(circuits, simulator), shots=shots,
+                           seed_simulator=seed).result()
+    print("\nHand-written circuits:")
+    for i, (name, qc) in enumerate(zip(functions, circuits)):
+        p = result.get_counts(i).get('0' * qc.num_clbits, 0) / shots
+        verdict = "CONSTANT" if p > 0.5 else "BALANCED"
+        print(f"{name:<22} P(0...0) = {p:.3f}  ->  {verdict}")
+
+    tables = deutsch_jozsa.truth_tables(functions.values(), 2)
+    p0 = deutsch_jozsa.zero_probabilities(tables)
+    print("\nBatched classification:")
+    for name, p in zip(functions, p0):
+        verdict = "CONSTANT" if p > 0.5 else "BALANCED"
+        print(f"{name:<22} P(00) = {p:.3f}  ->  {verdict}")
+
+    # Thousands of random constant/balanced functions in one call
+    tables, constant = deutsch_jozsa.random_tables(num_functions, n_inputs, seed=seed)
+    start = time.perf_counter()
+    verdicts = deutsch_jozsa.classify(tables)
+    elapsed = time.perf_counter() - start
+    print(f"\nClassified {num_functions} random {n_inputs}-input functions in {elapsed:.2f} s, "
+          f"{np.mean(verdicts == constant):.1%} correct")
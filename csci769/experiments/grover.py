@@ -0,0 +1,210 @@
+"""HW4/2: Grover search for the minimum |0...0> and maximum |1...1> of n qubits."""
+import numpy as np
+from qiskit import QuantumCircuit
+
+
+def create_oracle_min(n=3):
+    from csci769 import mcx
+
+    oracle = QuantumCircuit(n)
+
+    for i in range(n):
+        oracle.x(i)
+
+
+    oracle.h(n-1)
+    mcx.apply_mcx(oracle, list(range(n-1)), n-1)
+    oracle.h(n-1)
+
+    for i in range(n):
+        oracle.x(i)
+
+    return oracle
+
+def create_oracle_max(n=3):
+    from csci769 import mcx
+
+    oracle = QuantumCircuit(n)
+
+
+    oracle.h(n-1)
+    mcx.apply_mcx(oracle, list(range(n-1)), n-1)
+    oracle.h(n-1)
+
+    return oracle
+
+def create_diffusion(n=3):
+    from csci769 import mcx
+
+    diffusion = QuantumCircuit(n)
+
+    for i in range(n):
+        diffusion.h(i)
+
+    for i in range(n):
+        diffusion.x(i)
+
+    diffusion.h(n-1)
+    mcx.apply_mcx(diffusion, list(range(n-1)), n-1)
+    diffusion.h(n-1)
+
+    # Apply X gates to all qubits
+    for i in range(n):
+        diffusion.x(i)
+
+    # Apply H gates to all qubits
+    for i in range(n):
+        diffusion.h(i)
+
+    return diffusion
+
+def build_grover_circuit(oracle_func, iterations, n=3):
+    qc = QuantumCircuit(n, n)
+
+    for i in range(n):
+        qc.h(i)
+
+    oracle = oracle_func(n)
+    diffusion = create_diffusion(n)
+
+    for _ in range(iterations):
+        qc = qc.compose(oracle)
+        qc = qc.compose(diffusion)
+
+    qc.measure(range(n), range(n))
+    return qc
+
+def run_grover(oracle_func, iterations, target_state, n=3, shots=100, seed=0):
+    from csci769 import execution, store, trace
+
+    with trace.span('build', iterations=iterations) as span:
+        qc = span.circuit(build_grover_circuit(oracle_func, iterations, n))
+
+    # Get the circuit depth
+    depth = qc.depth()
+    simulator = execution.get_backend('qasm_simulator')
+
+    # Seeded, so reruns load the counts from the on-disk result store
+    result = store.run(qc, simulator, shots=shots, seed=seed)
+    with trace.span('postprocess'):
+        counts = {state: count / shots for state, count in result.get_counts().items()}
+
+        # Calculate probability of the target state
+        if target_state in counts:
+            target_prob = counts[target_state]
+        else:
+            target_prob = 0
+
+    return qc, counts, target_prob, depth
+
+
+def plot_iterations(iterations_list, min_results, max_results, curve_min, curve_max,
+                    optimal_iterations, target_min, target_max):
+    import matplotlib.pyplot as plt
+
+    max_k = len(curve_min) - 1
+    plt.figure(figsize=(10, 6))
+    iterations_array = np.array(iterations_list)
+    min_probs = [result[2] for result in min_results]
+    max_probs = [result[2] for result in max_results]
+
+    plt.plot(np.arange(max_k + 1), curve_min, '-', color='C0', alpha=0.5, label=f'Exact curve (|{target_min}⟩)')
+    plt.plot(np.arange(max_k + 1), curve_max, '--', color='C1', alpha=0.5, label=f'Exact curve (|{target_max}⟩)')
+    plt.plot(iterations_array, min_probs, 'o', color='C0', label=f'Minimum (|{target_min}⟩)')
+    plt.plot(iterations_array, max_probs, 's', color='C1', label=f'Maximum (|{target_max}⟩)')
+    plt.axvline(x=optimal_iterations, color='r', linestyle='--', label=f'Optimal ({optimal_iterations:.2f})')
+    plt.xlabel('Number of Iterations')
+    plt.ylabel('Probability of Target State')
+    plt.title("Effect of Iteration Count on Target State Probability")
+    plt.xticks(iterations_array)
+    plt.ylim(0, 1)
+    plt.grid(True)
+    plt.legend()
+    plt.savefig('grover_iterations_comparison.png', dpi=300, bbox_inches='tight')
+    plt.show()
+
+
+def main(n=3, iterations_list=(2, 3, 8), shots=100, seed=0, large=(8, 16, 20), plot=True):
+    from csci769 import grover
+
+    iterations_list = list(iterations_list)
+    target_min = '0' * n
+    target_max = '1' * n
+
+    min_results = []
+    max_results = []
+
+    # Run for minimum
+    print(f"Grover's Algorithm for finding |{target_min}⟩ (minimum):")
+    print("===============================================")
+    for iterations in iterations_list:
+        print(f"\nRunning with {iterations} iterations:")
+        qc_min, counts_min, prob_min, depth_min = run_grover(create_oracle_min, iterations, target_min,
+                                                             n, shots, seed)
+        min_results.append((iterations, counts_min, prob_min, depth_min))
+        print(f"Circuit depth: {depth_min}")
+        print(f"Probability of measuring |{target_min}⟩: {prob_min:.4f}")
+        print(f"Counts: {counts_min}")
+
+    # Run for maximum
+    print(f"\nGrover's Algorithm for finding |{target_max}⟩ (maximum):")
+    print("===============================================")
+    for iterations in iterations_list:
+        print(f"\nRunning with {iterations} iterations:")
+        qc_max, counts_max, prob_max, depth_max = run_grover(create_oracle_max, iterations, target_max,
+                                                             n, shots, seed)
+        max_results.append((iterations, counts_max, prob_max, depth_max))
+        print(f"Circuit depth: {depth_max}")
+        print(f"Probability of measuring |{target_max}⟩: {prob_max:.4f}")
+        print(f"Counts: {counts_max}")
+
+    # Calculate the optimal number of iterations
+    print("\nOptimal Number of Iterations Analysis:")
+    print("====================================")
+    N = 2**n
+    optimal_iterations = np.pi/4 * np.sqrt(N)
+    print(f"For n={n}, optimal iterations ≈ {optimal_iterations:.2f}")
+
+    # Full success-probability curve for k = 0..max(iterations_list), evolving one
+    # statevector an iterate at a time instead of re-simulating every k
+    max_k = max(iterations_list)
+    diffusion = create_diffusion(n)
+    curve_min = grover.success_curve(create_oracle_min(n), diffusion, max_k, [target_min])[:, 0]
+    curve_max = grover.success_curve(create_oracle_max(n), diffusion, max_k, [target_max])[:, 0]
+    print("\nExact success probability per iteration:")
+    for k in range(max_k + 1):
+        print(f"k={k}: |{target_min}⟩ {curve_min[k]:.4f}   |{target_max}⟩ {curve_max[k]:.4f}")
+
+    if plot:
+        plot_iterations(iterations_list, min_results, max_results, curve_min, curve_max,
+                        optimal_iterations, target_min, target_max)
+
+    # Create a table with the results
+    width = max(15, n + 10)
+    print("\nResults Summary Table:")
+    print("=====================")
+    print(f"{'Iterations':<12}{f'|{target_min}⟩ Prob':<{width}}{f'|{target_min}⟩ Depth':<{width}}"
+          f"{f'|{target_max}⟩ Prob':<{width}}{f'|{target_max}⟩ Depth':<{width}}")
+    print("-" * (12 + 4 * width))
+    for i in range(len(iterations_list)):
+        print(f"{iterations_list[i]:<12}{min_results[i][2]:<{width}.4f}{min_results[i][3]:<{width}}"
+              f"{max_results[i][2]:<{width}.4f}{max_results[i][3]:<{width}}")
+
+    # The oracles only flip the sign of one basis state and the diffusion is a
+    # reflection about the uniform state, so for larger n apply them directly to
+    # the amplitude array instead of decomposing multi-controlled gates
+    print("\nDiagonal-oracle fast path for larger n:")
+    for n_large in large:
+        oracle = grover.DiagonalOracle(n_large, marked=[0])
+        k_opt = grover.optimal_iterations(n_large)
+        curve = grover.diagonal_success_curve(oracle, k_opt)
+        print(f"n={n_large}: {k_opt} iterations, probability of |{'0' * n_large}⟩ = {curve[-1]:.6f}")
+
+    print("\nSaving circuit text representations instead of images")
+    min_circuit = build_grover_circuit(create_oracle_min, 1, n)
+    max_circuit = build_grover_circuit(create_oracle_max, 1, n)
+    print("Minimum circuit:")
+    print(min_circuit)
+
+    print("\nMaximum circuit:")
+    print(max_circuit)
@@ -0,0 +1,61 @@
+"""HW5/b1: HHL for the assignment's 1x1 system, checked against numpy, with a sweep of C."""
+import numpy as np
+
+A = np.array([[1.0]])
+b = np.array([1.0])
+
+
+def main(n_clock=3, shots=4096, points=1000):
+    from qiskit import ClassicalRegister
+
+    from csci769 import execution, hhl, templates
+
+    # Evolution unitaries exp(iAt 2^j) and inversion rotations come from one
+    # eigendecomposition of A
+    qc = hhl.hhl_circuit(A, b, n_clock)
+
+    # A 1x1 system has no b qubits, so only the flag is measured then
+    k = len(b).bit_length() - 1
+    result_bits = ClassicalRegister(k, 'x')
+    flag = ClassicalRegister(1, 'flag')
+    qc.add_register(result_bits, flag)
+    if k:
+        qc.measure(qc.qregs[1], result_bits)
+    qc.measure(qc.qregs[2], flag)
+
+    simulator = execution.get_backend('aer_simulator')
+    compiled_circuit = execution.transpile(qc, simulator)
+    result = simulator.run(compiled_circuit, shots=shots).result()
+    counts = result.get_counts()
+
+    print("Circuit measurements (flag x):", counts)
+
+    # Keep the shots where the ancilla flagged a successful inversion
+    success = {}
+    for key, value in counts.items():
+        flag_bit, *x_bits = key.split()
+        if flag_bit == '1':
+            success[''.join(x_bits)] = value
+    total = sum(success.values())
+    print(f"Post-selection rate: {total / shots:.4f}")
+    if k:
+        print("Post-selected |x|^2 distribution:",
+              {key: value / total for key, value in success.items()})
+
+    solution = hhl.solve(A, b, n_clock)
+    print("HHL solution:        ", np.round(solution['x'].real, 4))
+    print("numpy.linalg.solve:  ", np.round(solution['exact'].real, 4))
+    print(f"Relative error: {solution['error']:.2e}")
+
+    # Sweep the inversion constant C with the rotation angles as symbolic
+    # parameters: one compilation and one job for all values of C
+    template, theta = templates.hhl_template(A, b, n_clock)
+    evolution = hhl.evolution(A)
+    C_max = np.min(np.abs(evolution.eigenvalues))
+    C_values = np.linspace(0.05, 1.0, points) * C_max
+    angles = np.array([evolution.inversion_angles(n_clock, C) for C in C_values])
+    probabilities = templates.probability_matrix(template, theta, angles)
+    success_probability = probabilities[:, 2**k:].sum(axis=1)  # flag = 1
+    print(f"\nSweep over {len(C_values)} values of C, probability matrix {probabilities.shape}")
+    for i in (0, len(C_values) // 2, len(C_values) - 1):
+        print(f"  C = {C_values[i]:.4f}: success probability {success_probability[i]:.4f}")
@@ -0,0 +1,121 @@
+"""HW4/3: phase estimation, its inverse, and QPE resolution curves."""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QFT, PhaseGate
+
+from csci769 import qpe
+
+
+def create_qpe_circuit(n_count, n_state, phase=np.pi / 4):
+    
+    qc = QuantumCircuit(n_count + n_state, n_count)
+    
+    qc.x(n_count)
+    
+    for qubit in range(n_count):
+        qc.h(qubit)
+    
+    
+    # Controlled-U^(2^i) as one controlled phase of 2^i * phase, so the
+    # gate count grows linearly with n_count instead of as 2^n_count
+    for i in range(n_count):
+        qpe.controlled_power(qc, PhaseGate(phase), 2**i, i, [n_count])
+    
+    # Apply inverse QFT to counting qubits
+    qc.append(QFT(n_count).inverse(), range(n_count))
+    
+    # Measure counting qubits
+    qc.measure(range(n_count), range(n_count))
+    
+    return qc
+
+# Function to create the inverse QPE circuit
+def create_inverse_qpe_circuit(original_qpe):
+    
+    n_qubits = original_qpe.num_qubits
+    
+    inverse_qc = QuantumCircuit(n_qubits)
+    circuit_no_measure = QuantumCircuit(n_qubits)
+    for instruction in original_qpe.data:
+        if instruction.operation.name != 'measure':
+            circuit_no_measure.append(instruction.operation, instruction.qubits)
+    
+    # Create the inverse by taking the adjoint (dagger)
+    inverse_qc = circuit_no_measure.inverse()
+    
+    return inverse_qc
+
+# Function to demonstrate that U†U|0⟩|u⟩ = |0⟩|u⟩
+def demonstrate_unitarity(n_count, n_state, phase=np.pi / 4):
+    
+    original_qpe = create_qpe_circuit(n_count, n_state, phase)
+    
+    qpe_no_measure = QuantumCircuit(original_qpe.num_qubits)
+    for instruction in original_qpe.data:
+        if instruction.operation.name != 'measure':
+            qpe_no_measure.append(instruction.operation, instruction.qubits)
+    
+    # Create the inverse QPE circuit
+    inverse_qpe = create_inverse_qpe_circuit(original_qpe)
+    
+    demo_circuit = QuantumCircuit(original_qpe.num_qubits, n_count)
+    
+    demo_circuit = demo_circuit.compose(qpe_no_measure)
+    demo_circuit.barrier()
+    
+    demo_circuit = demo_circuit.compose(inverse_qpe)
+    
+    demo_circuit.measure(range(n_count), range(n_count))
+    
+    return demo_circuit, qpe_no_measure, inverse_qpe
+
+
+def main(n_count=3, n_state=1, phase=np.pi / 4, sweep_counts=(3, 5), points=4096):
+    from qiskit.primitives import Sampler
+
+    from csci769 import execution, templates
+
+    original_qpe = create_qpe_circuit(n_count, n_state, phase)
+    print("Original QPE Circuit:")
+    print(original_qpe.draw())
+
+    inverse_qpe = create_inverse_qpe_circuit(original_qpe)
+    print("\nInverse QPE Circuit (U†):")
+    print(inverse_qpe.draw())
+
+    demo_circuit, qpe_no_measure, inverse_qpe_clean = demonstrate_unitarity(n_count, n_state, phase)
+    print("\nFull Demonstration Circuit (U†U|0⟩|u⟩ = |0⟩|u⟩):")
+    print(demo_circuit.draw())
+
+    simulator = execution.get_backend('statevector_simulator')
+    transpiled_circuit = execution.transpile(demo_circuit, simulator)
+    sampler = Sampler()
+    job = sampler.run([transpiled_circuit], shots=1024)
+    result = job.result()
+    counts = result.quasi_dists[0].binary_probabilities()
+
+    print("\nSimulation Results:")
+    for outcome, probability in counts.items():
+        print(f"Outcome: |{outcome}⟩, Probability: {probability:.4f}")
+
+    zeros_state = '0' * n_count
+    if zeros_state in counts:
+        if counts[zeros_state] > 0.9:  # Allow for some numerical error
+            print(f"\nDemonstration successful! Probability of measuring |{zeros_state}⟩: {counts[zeros_state]:.4f}")
+            print("This confirms that U†U|0⟩|u⟩ = |0⟩|u⟩")
+        else:
+            print(f"\nDemonstration uncertain. Probability of measuring |{zeros_state}⟩: {counts[zeros_state]:.4f}")
+    else:
+        print("\nDemonstration failed. State |000⟩ not measured.")
+
+    # Resolution curve: the same QPE circuit with the phase as a symbolic
+    # parameter, compiled once and bound to thousands of phases in one job
+    for n_sweep in sweep_counts:
+        template, phi = templates.qpe_template(n_sweep)
+        phases = np.linspace(0, 2 * np.pi, points, endpoint=False)
+        probabilities = templates.probability_matrix(template, phi, phases)
+        estimates = probabilities.argmax(axis=1) * 2 * np.pi / 2**n_sweep
+        error = np.abs(np.angle(np.exp(1j * (estimates - phases))))
+        print(f"\n{n_sweep} counting qubits, {len(phases)} phases: probability matrix {probabilities.shape}")
+        print(f"  mean peak probability {probabilities.max(axis=1).mean():.4f}, "
+              f"worst-case phase error {error.max():.4f} rad (bin width {2 * np.pi / 2**n_sweep:.4f})")
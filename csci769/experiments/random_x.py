@@ -0,0 +1,64 @@
+"""HW3/1a: a randomly applied X gate, once and over many trials."""
+import random
+
+from qiskit import QuantumCircuit
+
+
+def random_x_gate_circuit(shots=100):
+    from csci769 import execution
+
+    qc = QuantumCircuit(1, 1)
+    
+    should_apply_x = random.random() < 0.5
+    if should_apply_x:
+        qc.x(0)  
+        print("X gate applied - expecting to measure |1⟩")
+    else:
+        print("No X gate applied - expecting to measure |0⟩")
+    
+    qc.measure(0, 0)
+    print("Circuit:")
+    print(qc.draw())
+    
+    simulator = execution.get_backend('qasm_simulator')
+    job = simulator.run(qc, shots=shots)
+    result = job.result()
+    counts = result.get_counts(qc)
+    
+    return counts, should_apply_x
+
+
+def plot_counts(labels, values, title):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(8, 6))
+    plt.bar(labels, values)
+    plt.title(title)
+    plt.xlabel('Measured State')
+    plt.ylabel('Count')
+    plt.grid(axis='y', alpha=0.75)
+    plt.show()
+
+
+def main(trials=100, seed=None, plot=True):
+    from csci769 import execution, sampling
+
+    counts, x_applied = random_x_gate_circuit()
+    print(f"Measurement results: {counts}")
+    if plot:
+        plot_counts(list(counts.keys()), list(counts.values()),
+                    f"Results of {'X Gate Applied' if x_applied else 'No X Gate Applied'}")
+
+    print(f"\nRunning {trials} separate experiments...")
+
+    # One circuit, one shot per trial: the X decision is randomized per shot
+    # on the simulator and every shot's outcome comes back in the memory array.
+    simulator = execution.get_backend('qasm_simulator')
+    applied, outcomes = sampling.random_x_trials(trials, backend=simulator, seed=seed)
+    ones = int(outcomes.sum())
+    zeros = len(outcomes) - ones
+
+    print(f"Number of |0⟩ measurements: {zeros}")
+    print(f"Number of |1⟩ measurements: {ones}")
+    if plot:
+        plot_counts(['|0⟩', '|1⟩'], [zeros, ones], f'Results of {trials} Random X Gate Applications')
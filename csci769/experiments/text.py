@@ -0,0 +1,100 @@
+"""q1: encode strings as X gates on one qubit per bit, measure and decode."""
+from qiskit import QuantumCircuit
+
+TEST_STRINGS = ["RIT", "QIS", "GOS"]
+
+# Longer than 8 characters, so its circuit has more than 64 clbits
+CHECK_STRING = "CSCI769 HELLO"
+
+
+def string_to_binary(s):
+    """Convert string to binary representation"""
+    binary = ''.join(format(ord(c), '08b') for c in s)
+    return binary
+
+
+def create_circuit(binary_string):
+    """Create quantum circuit for given binary string"""
+    n_qubits = len(binary_string)
+    qc = QuantumCircuit(n_qubits, n_qubits)
+    
+    # Apply X gates where there are 1s in the binary string
+    for i, bit in enumerate(binary_string):
+        if bit == '1':
+            qc.x(i)
+    
+    qc.barrier()  
+    qc.measure_all()
+    
+    return qc
+
+
+def run_simulation(circuit, shots=1000):
+    """Run circuit on simulator"""
+    from csci769 import execution, factorize
+
+    # Every character bit sits on its own qubit, so simulate the qubits
+    # independently (X-only components never touch a statevector)
+    counts = factorize.get_counts(circuit, shots=shots, backend=execution.get_backend())
+    formatted_counts = {}
+    for state, count in counts.items():
+        formatted_counts[state] = count
+        
+    return formatted_counts
+
+
+def binary_to_string(binary):
+    """Convert binary back to string"""
+    # Reverse the binary string to correct the order
+    binary = ''.join(reversed(binary))
+    return ''.join(chr(int(binary[i:i+8], 2)) for i in range(0, len(binary), 8))
+
+
+def round_trip(text, shots=100):
+    """Encode, simulate and decode `text`; raises RuntimeError if it comes back changed."""
+    counts = run_simulation(create_circuit(string_to_binary(text)), shots)
+    # measure_all writes the bits into its own register, printed first
+    decoded = [binary_to_string(state.split(' ')[0]) for state in counts]
+    if decoded != [text]:
+        raise RuntimeError(f"{text!r} decoded as {decoded!r}")
+    return decoded[0]
+
+
+def stream_round_trip(text, **options):
+    """Round-trip `text` block by block through q1's circuits with csci769.text_stream."""
+    from csci769 import text_stream
+
+    decoded = ''.join(text_stream.stream_roundtrip(text, **options))
+    if decoded != text:
+        raise RuntimeError(f"streamed text of {len(text)} characters came back changed")
+    return decoded
+
+
+def main(strings=TEST_STRINGS, shots=1000):
+    for test_string in strings:
+        print(f"\nTesting string: {test_string}")
+        binary = string_to_binary(test_string)
+        print(f"Binary representation: {binary}")
+        
+        circuit = create_circuit(binary)
+        print("\nCircuit:")
+        print(circuit)
+        
+        counts = run_simulation(circuit, shots)
+        
+        total_shots = sum(counts.values())
+        
+        print(f"\nResults from {total_shots} shots:")
+        for measured_binary, count in counts.items():
+            measured_binary_corrected = ''.join(reversed(measured_binary))
+            try:
+                decoded = binary_to_string(measured_binary)
+                print(f"{measured_binary_corrected} ({decoded}): {count} times")
+            except ValueError:
+                print(f"{measured_binary_corrected} (invalid): {count} times")
+
+    print(f"\nRound trip of {CHECK_STRING!r} ({8 * len(CHECK_STRING)} clbits): "
+          f"{round_trip(CHECK_STRING)!r}")
+
+    streamed = stream_round_trip(' '.join(strings) * 10000)
+    print(f"Streamed {len(streamed)} characters through 16-byte q1 circuits")
@@ -0,0 +1,213 @@
+"""Shor factoring for arbitrary small odd composite N with parallel bases.
+
+Each trial picks a base a, runs semiclassical order finding on the
+permutation unitaries from `csci769.shor` (width N.bit_length() + 1, so
+N up to about 2^8 simulates quickly) and turns the period into a factor.
+Trials for every N of a batch share one process pool. As soon as some base
+factors N, the queued trials of that N are cancelled and its slots go to
+the numbers still being worked on.
+
+Examples:
+    python -m csci769.factoring 15 21 33 35 91
+    python -m csci769.factoring --benchmark --limit 128
+"""
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import gcd, isqrt
+
+import numpy as np
+
+from csci769 import execution, period, shor
+
+def _perfect_power_root(N):
+    """Some b > 1 with b^k = N for k >= 2, or None."""
+    for k in range(2, N.bit_length() + 1):
+        b = round(N ** (1 / k))
+        for c in (b - 1, b, b + 1):
+            if c > 1 and c ** k == N:
+                return c
+    return None
+
+
+def classical_factor(N):
+    """A factor found without order finding (even N or prime powers), or None."""
+    if N % 2 == 0:
+        return 2
+    return _perfect_power_root(N)
+
+
+def is_prime(N):
+    return N > 1 and all(N % k for k in range(2, isqrt(N) + 1))
+
+
+def odd_composites(limit, start=15):
+    """Odd composites in [start, limit) that are not prime powers."""
+    return [N for N in range(start | 1, limit, 2)
+            if not is_prime(N) and _perfect_power_root(N) is None]
+
+
+def factor_from_period(a, N, r):
+    """Nontrivial factor of N from the period r of a, or None."""
+    if r is None or r % 2:
+        return None
+    half = pow(a, r // 2, N)
+    if half == N - 1:
+        return None
+    for candidate in (gcd(half - 1, N), gcd(half + 1, N)):
+        if 1 < candidate < N:
+            return candidate
+    return None
+
+
+def try_base(N, a, shots=8, precision=None, seed=0, max_shots=256):
+    """One order-finding trial of base a. Returns a result dict.
+
+    Shots are taken `shots` at a time until the period is confirmed (see
+    `csci769.period.estimate_period`).
+    """
+    start = time.perf_counter()
+    result = {'N': N, 'a': a, 'period': None, 'factor': None, 'shots': 0}
+    common = gcd(a, N)
+    if common > 1:
+        result['factor'] = common
+    else:
+        if precision is None:
+            precision = 2 * N.bit_length()
+        # Shot branching shares the statevector between shots until their
+        # mid-circuit measurements differ. Trials bypass the result store so
+        # that benchmark timings measure simulation
+        estimate = period.estimate_period(
+            a, N, shor.semiclassical_circuit(a, N, precision), precision, execution.get_backend(),
+            batch=shots, max_shots=max_shots, seed=[seed, N, a], cache=False,
+            shot_branching_enable=True)
+        result['shots'] = estimate['shots']
+        result['period'] = estimate['period']
+        result['factor'] = factor_from_period(a, N, result['period'])
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _bases(N, seed):
+    """Coprime bases in a seeded random order."""
+    rng = np.random.default_rng([seed, N])
+    return [int(a) for a in rng.permutation(np.arange(2, N - 1)) if gcd(int(a), N) == 1]
+
+
+def factor_batch(numbers, shots=8, max_workers=None, seed=0, per_number=2):
+    """Factor every N in `numbers`, trying bases in parallel.
+
+    At most `per_number` trials of one N are in flight at a time. Returns
+    {N: {'factors', 'a', 'period', 'trials', 'seconds'}}; factors is None
+    if every base failed.
+    """
+    start = time.perf_counter()
+    results = {}
+    pending = {}
+    queues = {}
+    for N in numbers:
+        factor = classical_factor(N)
+        if factor is not None:
+            results[N] = {'factors': (factor, N // factor), 'a': None, 'period': None,
+                          'trials': 0, 'seconds': 0.0}
+        else:
+            queues[N] = _bases(N, seed)
+            results[N] = {'factors': None, 'a': None, 'period': None, 'trials': 0,
+                          'seconds': None}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        def submit(N):
+            a = queues[N].pop(0)
+            pending[pool.submit(try_base, N, a, shots, None, seed)] = N
+
+        for N in queues:
+            for _ in range(min(per_number, len(queues[N]))):
+                submit(N)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                N = pending.pop(future)
+                if future.cancelled() or results[N]['factors'] is not None:
+                    continue
+                trial = future.result()
+                results[N]['trials'] += 1
+                if trial['factor'] is not None:
+                    factor = trial['factor']
+                    results[N].update(factors=(factor, N // factor), a=trial['a'],
+                                      period=trial['period'],
+                                      seconds=time.perf_counter() - start)
+                    # Early exit: drop this N's queued trials
+                    queues[N] = []
+                    for other, owner in list(pending.items()):
+                        if owner == N and other.cancel():
+                            del pending[other]
+                elif queues[N]:
+                    submit(N)
+                else:
+                    results[N]['seconds'] = time.perf_counter() - start
+    return results
+
+
+def factor(N, shots=8, max_workers=None, seed=0, per_number=None):
+    """Factor a single N using every worker on its bases."""
+    if per_number is None:
+        per_number = max_workers or 4
+    return factor_batch([N], shots, max_workers, seed, per_number)[N]
+
+
+def benchmark(numbers, shots=8, max_workers=None, seed=0):
+    """Time-to-factor of each N, factoring them one at a time."""
+    rows = []
+    for N in numbers:
+        start = time.perf_counter()
+        result = factor(N, shots, max_workers, seed)
+        rows.append({
+            'N': N,
+            'bits': N.bit_length(),
+            'factors': result['factors'],
+            'a': result['a'],
+            'period': result['period'],
+            'trials': result['trials'],
+            'seconds': time.perf_counter() - start,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('numbers', type=int, nargs='*')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='time-to-factor for every odd composite below --limit')
+    parser.add_argument('--limit', type=int, default=256)
+    parser.add_argument('--shots', type=int, default=8,
+                        help='shots per adaptive batch')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        print(f"{'N':<6}{'bits':<6}{'factors':<12}{'a':<6}{'r':<6}{'trials':<8}{'seconds':<8}")
+        print("-" * 52)
+        for row in benchmark(args.numbers or odd_composites(args.limit), args.shots,
+                             args.workers, args.seed):
+            factors = '%d x %d' % row['factors'] if row['factors'] else '-'
+            print(f"{row['N']:<6}{row['bits']:<6}{factors:<12}{str(row['a']):<6}"
+                  f"{str(row['period']):<6}{row['trials']:<8}{row['seconds']:<8.2f}")
+        return
+
+    start = time.perf_counter()
+    results = factor_batch(args.numbers or odd_composites(64), args.shots,
+                           args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    for N, result in results.items():
+        if result['factors']:
+            p, q = result['factors']
+            print(f"{N} = {p} x {q}  (a = {result['a']}, r = {result['period']}, "
+                  f"{result['trials']} trials)")
+        else:
+            print(f"{N}: no factor found in {result['trials']} trials")
+    print(f"{len(results)} numbers in {elapsed:.2f} s ({len(results) / elapsed:.2f} N/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Split circuits into independent qubit groups and simulate them separately.
+
+Qubits that never share a gate end up in different connected components of
+the circuit's interaction graph. The measured distribution is then the
+product of the per-component distributions, so each component can be
+simulated on its own and the cost scales with the largest component.
+"""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ControlFlowOp
+from qiskit.quantum_info import Statevector
+from qiskit_aer import Aer
+
+from csci769 import reversible
+from csci769.sampling import memory_to_array
+
+
+def _has_classical_control(qc):
+    for inst in qc.data:
+        if isinstance(inst.operation, ControlFlowOp):
+            return True
+        if getattr(inst.operation, 'condition', None) is not None:
+            return True
+    return False
+
+
+def connected_components(qc):
+    """Group qubits (and the clbits they are measured into) by interaction.
+
+    Returns a list of (qubits, clbits) index lists. Circuits with classically
+    controlled operations are returned as one component.
+    """
+    n, m = qc.num_qubits, qc.num_clbits
+    if _has_classical_control(qc):
+        return [(list(range(n)), list(range(m)))]
+
+    # Qubits are nodes 0..n-1 and clbits are nodes n..n+m-1
+    parent = list(range(n + m))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for inst in qc.data:
+        if inst.operation.name == 'barrier':
+            continue
+        nodes = [qc.find_bit(q).index for q in inst.qubits]
+        nodes += [n + qc.find_bit(c).index for c in inst.clbits]
+        root = find(nodes[0]) if nodes else None
+        for node in nodes[1:]:
+            parent[find(node)] = root
+
+    groups = {}
+    for node in range(n + m):
+        groups.setdefault(find(node), []).append(node)
+    components = []
+    for nodes in groups.values():
+        qubits = [i for i in nodes if i < n]
+        clbits = [i - n for i in nodes if i >= n]
+        if qubits:
+            components.append((qubits, clbits))
+    components.sort(key=lambda comp: comp[0][0])
+    return components
+
+
+def split_circuit(qc):
+    """Return one (qubits, clbits, subcircuit) triple per component."""
+    components = connected_components(qc)
+    if len(components) == 1:
+        qubits, clbits = components[0]
+        if len(qubits) == qc.num_qubits and len(clbits) == qc.num_clbits:
+            return [(qubits, clbits, qc)]
+
+    parts = []
+    for qubits, clbits in components:
+        sub = QuantumCircuit(len(qubits), len(clbits))
+        qmap = {q: i for i, q in enumerate(qubits)}
+        cmap = {c: i for i, c in enumerate(clbits)}
+        for inst in qc.data:
+            if inst.operation.name == 'barrier':
+                continue
+            qargs = [qc.find_bit(q).index for q in inst.qubits]
+            if qargs[0] not in qmap:
+                continue
+            cargs = [cmap[qc.find_bit(c).index] for c in inst.clbits]
+            sub.append(inst.operation, [qmap[q] for q in qargs], cargs)
+        parts.append((qubits, clbits, sub))
+    return parts
+
+
+def sample_bits(qc, shots=1024, backend=None, seed=None):
+    """Sample the circuit component by component.
+
+    Returns a (shots, num_clbits) uint8 array. Components without clbits
+    are never simulated and classical components use the bit simulator.
+    With a seed, every component gets its own seed spawned from it, so
+    identical components still sample independently.
+    """
+    if backend is None:
+        backend = Aer.get_backend('qasm_simulator')
+    bits = np.zeros((shots, qc.num_clbits), dtype=np.uint8)
+    parts = split_circuit(qc)
+    if seed is not None:
+        seeds = [int(s) for s in np.random.SeedSequence(seed).generate_state(len(parts))]
+    for k, (qubits, clbits, sub) in enumerate(parts):
+        if not clbits:
+            continue
+        if reversible.is_classical(sub):
+            _, value = reversible.simulate(sub)
+            for i, c in enumerate(clbits):
+                bits[:, c] = (value >> i) & 1
+            continue
+        options = {'shots': shots, 'memory': True}
+        if seed is not None:
+            options['seed_simulator'] = seeds[k]
+        memory = backend.run(sub, **options).result().get_memory()
+        bits[:, clbits] = memory_to_array(memory)
+    return bits
+
+
+def get_counts(qc, shots=1024, backend=None, seed=None):
+    """Counts dictionary in Aer's format, built from per-component samples."""
+    # Unique rows rather than packed integers, so any number of clbits works
+    rows, counts = np.unique(sample_bits(qc, shots, backend, seed), axis=0, return_counts=True)
+    packed = np.packbits(rows, axis=1, bitorder='little')
+    return {reversible.format_clbits(qc, int.from_bytes(row.tobytes(), 'little')): int(c)
+            for row, c in zip(packed, counts)}
+
+
+def _component_distribution(sub):
+    """Exact {clbit_int: probability} for one component with final measurements."""
+    if reversible.is_classical(sub):
+        _, value = reversible.simulate(sub)
+        return {value: 1.0}
+
+    unitary = QuantumCircuit(sub.num_qubits)
+    measured = {}
+    for inst in sub.data:
+        qargs = [sub.find_bit(q).index for q in inst.qubits]
+        if inst.operation.name == 'measure':
+            measured[qargs[0]] = sub.find_bit(inst.clbits[0]).index
+            continue
+        if any(q in measured for q in qargs):
+            raise ValueError("only final measurements are supported")
+        unitary.append(inst.operation, qargs)
+
+    qargs = list(measured)
+    probs = Statevector(unitary).probabilities(qargs)
+    dist = {}
+    for index in np.flatnonzero(probs > 1e-12):
+        value = 0
+        for i, q in enumerate(qargs):
+            value |= ((int(index) >> i) & 1) << measured[q]
+        dist[value] = dist.get(value, 0.0) + float(probs[index])
+    return dist
+
+
+def probabilities(qc):
+    """Exact measured distribution as a product of component distributions.
+
+    Keys are clbit strings (clbit 0 rightmost), like
+    `binary_probabilities()` on a sampler result.
+    """
+    total = {0: 1.0}
+    for qubits, clbits, sub in split_circuit(qc):
+        if not clbits:
+            continue
+        dist = _component_distribution(sub)
+        shifted = {}
+        for value, p in dist.items():
+            full = 0
+            for i, c in enumerate(clbits):
+                full |= ((value >> i) & 1) << c
+            shifted[full] = p
+        total = {a | b: pa * pb for a, pa in total.items() for b, pb in shifted.items()}
+    width = qc.num_clbits
+    return {format(value, f'0{width}b'): p for value, p in total.items()}
@@ -0,0 +1,119 @@
+"""Grover iteration sweeps on a single evolving statevector.
+
+Instead of rebuilding and re-simulating a k-iterate circuit for every k,
+one circuit applies the oracle + diffusion iterate K times and saves the
+target probabilities after every step. The whole success-probability curve
+costs K iterate applications instead of K (K + 1) / 2.
+
+For large n the oracle and diffusion are better treated as what they are:
+a diagonal sign flip on the marked states and a reflection about the
+uniform state. `DiagonalOracle` and `diagonal_success_curve` apply them
+directly to a real amplitude array in place, with no gate decomposition.
+Grover amplitudes stay real, so 2^28 amplitudes fit in 2 GiB as float64
+or 1 GiB as float32.
+"""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_aer.library import SaveAmplitudesSquared
+
+from csci769 import execution
+
+
+def _target_indices(targets, n):
+    indices = []
+    for target in targets:
+        index = int(target, 2) if isinstance(target, str) else int(target)
+        if not 0 <= index < 2 ** n:
+            raise ValueError(f"target {target!r} is out of range for {n} qubits")
+        indices.append(index)
+    return indices
+
+
+def success_curve(oracle, diffusion, max_iterations, targets, backend=None):
+    """Target probabilities after k = 0..max_iterations Grover iterates.
+
+    `targets` are basis states given as bitstrings (qubit 0 rightmost) or
+    integers. Returns an array of shape (max_iterations + 1, len(targets)).
+    """
+    n = oracle.num_qubits
+    indices = _target_indices(targets, n)
+    if backend is None:
+        backend = execution.get_backend(method='statevector')
+
+    # Transpile one iterate and repeat it, rather than transpiling K copies
+    iterate = execution.transpile(oracle.compose(diffusion), backend)
+    qc = QuantumCircuit(n)
+    qc.h(range(n))
+    qc.append(SaveAmplitudesSquared(n, indices, label='k0'), range(n))
+    for k in range(1, max_iterations + 1):
+        qc.compose(iterate, inplace=True)
+        qc.append(SaveAmplitudesSquared(n, indices, label=f'k{k}'), range(n))
+
+    data = backend.run(qc, shots=1).result().data(0)
+    return np.array([data[f'k{k}'] for k in range(max_iterations + 1)])
+
+
+def optimal_iterations(n, num_marked=1):
+    """Iteration count that maximizes the success probability."""
+    theta = np.arcsin(np.sqrt(num_marked / 2 ** n))
+    return int(np.floor(np.pi / (4 * theta)))
+
+
+class DiagonalOracle:
+    """Phase oracle diag((-1)^f(x)) defined by marked indices or a predicate.
+
+    `predicate` is a vectorized function taking a uint64 array of basis
+    indices and returning a boolean array. It is evaluated once, in chunks,
+    to collect the marked indices.
+    """
+
+    def __init__(self, n, marked=None, predicate=None, chunk=1 << 22):
+        if (marked is None) == (predicate is None):
+            raise ValueError("give exactly one of marked or predicate")
+        self.n = n
+        if isinstance(marked, np.ndarray):
+            self.marked = np.unique(marked.astype(np.int64))
+        elif marked is not None:
+            self.marked = np.unique(np.asarray(_target_indices(marked, n), dtype=np.int64))
+        else:
+            found = []
+            for start in range(0, 2 ** n, chunk):
+                index = np.arange(start, min(start + chunk, 2 ** n), dtype=np.uint64)
+                found.append(np.flatnonzero(predicate(index)) + start)
+            self.marked = np.concatenate(found).astype(np.int64)
+
+    def apply(self, state):
+        """Flip the sign of the marked amplitudes in place."""
+        state[self.marked] *= -1
+
+
+def apply_diffusion(state):
+    """Reflect about the uniform superposition in place: a -> 2 mean(a) - a."""
+    mean = state.mean(dtype=np.float64)
+    np.subtract(state.dtype.type(2 * mean), state, out=state)
+
+
+def diagonal_success_curve(oracle, max_iterations, targets=None, dtype=np.float64):
+    """Success probability after k = 0..max_iterations using diagonal operators.
+
+    Without `targets` the probability of measuring any marked state is
+    returned, otherwise the probability of each target. Returns an array of
+    shape (max_iterations + 1,) or (max_iterations + 1, len(targets)).
+    """
+    n = oracle.n
+    if targets is None:
+        watch = oracle.marked
+        record = lambda state: np.sum(state[watch] ** 2, dtype=np.float64)
+        curve = np.empty(max_iterations + 1)
+    else:
+        watch = np.asarray(_target_indices(targets, n))
+        record = lambda state: state[watch] ** 2
+        curve = np.empty((max_iterations + 1, len(watch)))
+
+    state = np.full(2 ** n, 1 / np.sqrt(2 ** n), dtype=dtype)
+    curve[0] = record(state)
+    for k in range(1, max_iterations + 1):
+        oracle.apply(state)
+        apply_diffusion(state)
+        curve[k] = record(state)
+    return curve
@@ -0,0 +1,165 @@
+"""HHL for Hermitian 2^k x 2^k systems A x = b, k >= 0.
+
+A is eigendecomposed once. Every controlled exp(i A t 2^j) the clock
+register needs is built from the eigenpairs as V diag(e^(i lambda t 2^j)) V^dagger
+and cached on the `HamiltonianEvolution`, so growing the clock register only
+adds the new powers. `evolution` keeps one instance per (A, t), so sweeps
+over clock sizes and over several matrices never recompute a unitary.
+
+Eigenvalues are mapped to clock phases lambda t / 2 pi in [-1/4, 1/4], with
+t = pi / (2 max|lambda|) by default, so that clock values above 2^(n-1) read
+unambiguously as negative eigenvalues. The inversion rotation for clock value y is
+RY(2 arcsin(C / lambda(y))) with C = min|lambda| from the spectrum.
+
+A 1 x 1 system (k = 0) has an empty b register: every controlled power
+is a phase rotation on its clock qubit, and the sign of b is carried as
+a global phase.
+"""
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import QFT, PhaseGate, StatePreparation, UCRYGate, UnitaryGate
+from qiskit.quantum_info import Statevector
+
+
+class HamiltonianEvolution:
+    """Cached controlled powers of exp(i A t) for Hermitian A."""
+
+    def __init__(self, A, t=None):
+        A = np.asarray(A, dtype=complex)
+        dim = A.shape[0]
+        if A.shape != (dim, dim) or dim < 1 or dim & (dim - 1):
+            raise ValueError("A must be a 2^k x 2^k matrix")
+        if not np.allclose(A, A.conj().T):
+            raise ValueError("A must be Hermitian")
+        self.num_qubits = dim.bit_length() - 1
+        self.eigenvalues, self.eigenvectors = np.linalg.eigh(A)
+        if np.any(np.isclose(self.eigenvalues, 0)):
+            raise ValueError("A is singular")
+        self.t = np.pi / (2 * np.max(np.abs(self.eigenvalues))) if t is None else float(t)
+        self._gates = {}
+
+    def unitary(self, power):
+        """exp(i A t power) from the eigendecomposition."""
+        phases = np.exp(1j * self.eigenvalues * self.t * power)
+        return (self.eigenvectors * phases) @ self.eigenvectors.conj().T
+
+    def controlled(self, j, inverse=False):
+        """Controlled exp(+-i A t 2^j) with the control as qubit 0."""
+        key = (j, inverse)
+        if key not in self._gates:
+            power = -2 ** j if inverse else 2 ** j
+            label = f"e^({'-' if inverse else ''}iAt2^{j})"
+            if self.num_qubits == 0:
+                self._gates[key] = PhaseGate(float(self.eigenvalues[0] * self.t * power),
+                                             label=label)
+                return self._gates[key]
+            U = self.unitary(power)
+            dim = U.shape[0]
+            # Index c + 2 x: identity on c = 0, U on c = 1
+            matrix = np.zeros((2 * dim, 2 * dim), dtype=complex)
+            matrix[0::2, 0::2] = np.eye(dim)
+            matrix[1::2, 1::2] = U
+            self._gates[key] = UnitaryGate(matrix, label=label)
+        return self._gates[key]
+
+    def clock_eigenvalues(self, n_clock):
+        """Eigenvalue estimate for every clock value 0..2^n_clock - 1."""
+        y = np.arange(2 ** n_clock)
+        signed = np.where(y > 2 ** (n_clock - 1), y - 2 ** n_clock, y)
+        return 2 * np.pi * signed / (self.t * 2 ** n_clock)
+
+    def inversion_angles(self, n_clock, C=None):
+        """RY angles 2 arcsin(C / lambda(y)), 0 for y = 0; C defaults to min |lambda|."""
+        if C is None:
+            C = np.min(np.abs(self.eigenvalues))
+        estimates = self.clock_eigenvalues(n_clock)
+        ratio = np.zeros_like(estimates)
+        nonzero = estimates != 0
+        ratio[nonzero] = np.clip(C / estimates[nonzero], -1, 1)
+        return 2 * np.arcsin(ratio)
+
+
+_evolutions = {}
+
+
+def evolution(A, t=None):
+    """Shared `HamiltonianEvolution` for (A, t)."""
+    A = np.ascontiguousarray(A, dtype=complex)
+    key = (A.shape, A.tobytes(), t)
+    if key not in _evolutions:
+        _evolutions[key] = HamiltonianEvolution(A, t)
+    return _evolutions[key]
+
+
+def hhl_circuit(A, b, n_clock, t=None):
+    """HHL circuit with registers clock (n_clock), b (k) and ancilla (1).
+
+    Post-selecting ancilla = 1 and clock = 0 leaves b in a state
+    proportional to A^-1 b.
+    """
+    ev = evolution(A, t)
+    b = np.asarray(b, dtype=complex)
+    if b.shape != (2 ** ev.num_qubits,):
+        raise ValueError(f"b must have length {2 ** ev.num_qubits}")
+    clock = QuantumRegister(n_clock, 'clock')
+    target = QuantumRegister(ev.num_qubits, 'b')
+    ancilla = QuantumRegister(1, 'ancilla')
+    qc = QuantumCircuit(clock, target, ancilla)
+
+    if ev.num_qubits:
+        qc.append(StatePreparation(b / np.linalg.norm(b)), target)
+    else:
+        qc.global_phase = float(np.angle(b[0]))
+    qc.h(clock)
+    for j in range(n_clock):
+        qc.append(ev.controlled(j), [clock[j]] + list(target))
+    qc.append(QFT(n_clock).inverse(), clock)
+
+    qc.append(UCRYGate(list(ev.inversion_angles(n_clock))), [ancilla[0]] + list(clock))
+
+    # Uncompute the phase estimation
+    qc.append(QFT(n_clock), clock)
+    for j in reversed(range(n_clock)):
+        qc.append(ev.controlled(j, inverse=True), [clock[j]] + list(target))
+    qc.h(clock)
+    return qc
+
+
+def solve(A, b, n_clock, t=None):
+    """Run HHL exactly and compare with numpy.linalg.solve.
+
+    Returns a dict with the HHL solution x (rescaled by |b| / C), the exact
+    solution, the relative error and the post-selection probability.
+    """
+    ev = evolution(A, t)
+    b = np.asarray(b, dtype=complex)
+    k = ev.num_qubits
+    state = Statevector(hhl_circuit(A, b, n_clock, t)).data
+    # Ancilla = 1, clock = 0: index 2^(n_clock + k) + (row << n_clock)
+    rows = np.arange(2 ** k)
+    amplitudes = state[(1 << (n_clock + k)) + (rows << n_clock)]
+    C = np.min(np.abs(ev.eigenvalues))
+    x = amplitudes * np.linalg.norm(b) / C
+    exact = np.linalg.solve(np.asarray(A, dtype=complex), b)
+    return {
+        'x': x,
+        'exact': exact,
+        'error': float(np.linalg.norm(x - exact) / np.linalg.norm(exact)),
+        'success_probability': float(np.sum(np.abs(amplitudes) ** 2)),
+    }
+
+
+def sweep(systems, clock_sizes, t=None):
+    """Relative error of every (A, b) system at every clock size."""
+    rows = []
+    for i, (A, b) in enumerate(systems):
+        for n_clock in clock_sizes:
+            result = solve(A, b, n_clock, t)
+            rows.append({
+                'system': i,
+                'size': len(b),
+                'n_clock': n_clock,
+                'error': result['error'],
+                'success_probability': result['success_probability'],
+            })
+    return rows
@@ -0,0 +1,161 @@
+"""Multi-controlled X synthesis strategies and an automatic chooser.
+
+Strategies and the ancillas they need for k controls:
+
+    noancilla      0                  Qiskit's ancilla-free synthesis
+    recursion      1 (dirty)          Qiskit's recursive split
+    v-chain        k - 2 (clean)      Qiskit's Toffoli chain
+    v-chain-dirty  k - 2 (dirty)      Qiskit's Toffoli chain on dirty qubits
+    log-depth      k - 2 (clean)      binary tree of Toffolis, O(log k) depth
+
+`choose_strategy` compiles each feasible strategy once per k to a
+CX + U basis, then picks the cheapest under a cost model ('cx' count or
+'depth'). The costs are cached.
+
+Run `python -m csci769.mcx` for a depth / gate-count table for n = 3..20.
+"""
+from functools import lru_cache
+
+from qiskit import QuantumCircuit, transpile
+
+STRATEGIES = ['noancilla', 'recursion', 'v-chain', 'v-chain-dirty', 'log-depth']
+_BASIS = ['cx', 'u']
+
+
+def ancillas_required(strategy, num_controls):
+    """Number of ancillas `strategy` needs for `num_controls` controls."""
+    if strategy == 'noancilla' or num_controls <= 2:
+        return 0
+    if strategy == 'recursion':
+        return 1 if num_controls > 4 else 0
+    if strategy in ('v-chain', 'v-chain-dirty', 'log-depth'):
+        return num_controls - 2
+    raise ValueError(f"unknown MCX strategy '{strategy}'")
+
+
+def needs_clean_ancillas(strategy):
+    return strategy in ('v-chain', 'log-depth')
+
+
+def _log_depth_mcx(qc, controls, target, ancillas):
+    """AND the controls pairwise in a tree of relative-phase Toffolis.
+
+    Each layer halves the number of live bits, so the compute and uncompute
+    stages are ceil(log2 k) - 1 layers deep. The relative phases of RCCX
+    cancel because every compute gate is undone by the same gate.
+    """
+    layer = list(controls)
+    free = list(ancillas)
+    compute = []
+    while len(layer) > 2:
+        next_layer = []
+        for i in range(0, len(layer) - 1, 2):
+            ancilla = free.pop(0)
+            compute.append((layer[i], layer[i + 1], ancilla))
+            next_layer.append(ancilla)
+        if len(layer) % 2:
+            next_layer.append(layer[-1])
+        layer = next_layer
+
+    for gate in compute:
+        qc.rccx(*gate)
+    if len(layer) == 2:
+        qc.ccx(layer[0], layer[1], target)
+    else:
+        qc.cx(layer[0], target)
+    for gate in reversed(compute):
+        qc.rccx(*gate)
+
+
+def append_mcx(qc, controls, target, ancillas=(), strategy='noancilla'):
+    """Append an MCX built with a specific strategy."""
+    controls = list(controls)
+    needed = ancillas_required(strategy, len(controls))
+    if len(ancillas) < needed:
+        raise ValueError(f"'{strategy}' needs {needed} ancillas for "
+                         f"{len(controls)} controls, got {len(ancillas)}")
+    ancillas = list(ancillas)[:needed]
+    if len(controls) <= 2:
+        if len(controls) == 2:
+            qc.ccx(controls[0], controls[1], target)
+        else:
+            qc.cx(controls[0], target)
+    elif strategy == 'log-depth':
+        _log_depth_mcx(qc, controls, target, ancillas)
+    else:
+        qc.mcx(controls, target, ancillas or None, mode=strategy)
+    return qc
+
+
+def _strategy_circuit(strategy, num_controls):
+    num_ancillas = ancillas_required(strategy, num_controls)
+    qc = QuantumCircuit(num_controls + 1 + num_ancillas)
+    ancillas = list(range(num_controls + 1, qc.num_qubits))
+    return append_mcx(qc, range(num_controls), num_controls, ancillas, strategy)
+
+
+@lru_cache(maxsize=None)
+def strategy_cost(strategy, num_controls):
+    """(cx count, depth, size) of one strategy compiled to CX + U."""
+    compiled = transpile(_strategy_circuit(strategy, num_controls),
+                         basis_gates=_BASIS, optimization_level=1)
+    return compiled.count_ops().get('cx', 0), compiled.depth(), compiled.size()
+
+
+def choose_strategy(num_controls, num_free=0, clean=True, metric='cx'):
+    """Cheapest strategy that fits in `num_free` free qubits.
+
+    `clean` says whether the free qubits are known to be in |0>. `metric`
+    is 'cx' or 'depth'.
+    """
+    index = {'cx': 0, 'depth': 1}[metric]
+    best = None
+    for strategy in STRATEGIES:
+        if ancillas_required(strategy, num_controls) > num_free:
+            continue
+        if needs_clean_ancillas(strategy) and not clean:
+            continue
+        cost = strategy_cost(strategy, num_controls)[index]
+        if best is None or cost < best[0]:
+            best = (cost, strategy)
+    return best[1]
+
+
+def apply_mcx(qc, controls, target, ancillas=(), clean=True, strategy='auto', metric='cx'):
+    """Append an MCX, picking the strategy automatically unless one is given."""
+    controls = list(controls)
+    if strategy == 'auto':
+        strategy = choose_strategy(len(controls), len(ancillas), clean, metric)
+    return append_mcx(qc, controls, target, ancillas, strategy)
+
+
+def benchmark(n_values=range(3, 21)):
+    """CX count, depth and size of every strategy for an n-qubit Grover MCX.
+
+    An n-qubit Grover oracle or diffusion needs an MCX with n - 1 controls.
+    """
+    rows = []
+    for n in n_values:
+        for strategy in STRATEGIES:
+            cx, depth, size = strategy_cost(strategy, n - 1)
+            rows.append({
+                'n': n,
+                'strategy': strategy,
+                'ancillas': ancillas_required(strategy, n - 1),
+                'cx': cx,
+                'depth': depth,
+                'size': size,
+            })
+    return rows
+
+
+def main():
+    print(f"{'n':<4}{'strategy':<16}{'ancillas':<10}{'cx':<8}{'depth':<8}{'size':<8}")
+    print("-" * 54)
+    for row in benchmark():
+        print(f"{row['n']:<4}{row['strategy']:<16}{row['ancillas']:<10}"
+              f"{row['cx']:<8}{row['depth']:<8}{row['size']:<8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Bit-packed Pauli-frame sampler for Clifford circuits.
+
+A noiseless reference run fixes one valid set of measurement outcomes.
+Every other shot is the reference plus a Pauli frame: the X/Z error
+components on each qubit, pushed through the Clifford gates. Frames for 64
+shots share one uint64 word, so a gate costs a few XORs over
+shots / 64 words instead of a full stabilizer or statevector update.
+Random measurement outcomes come from randomizing Z in the frame on every
+freshly prepared or measured qubit, as in Stim's frame simulator.
+"""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import StabilizerState
+
+_SINGLE = {'id', 'x', 'y', 'z', 'h', 's', 'sdg', 'sx', 'sxdg'}
+_TWO = {'cx', 'cz', 'swap'}
+_DENSE_P = 0.05
+
+
+def _random_words(rng, words):
+    return np.frombuffer(rng.bytes(8 * words), dtype=np.uint64).copy()
+
+
+def _error_positions(rng, p, shots):
+    """Indices of the shots hit by an independent error of probability p."""
+    if p >= _DENSE_P:
+        return np.flatnonzero(rng.random(shots) < p)
+    # Sparse errors: walk the shots with geometric gaps instead of drawing
+    # one random number per shot
+    expected = shots * p
+    size = int(expected + 6 * np.sqrt(expected) + 16)
+    positions = np.cumsum(rng.geometric(p, size)) - 1
+    while positions[-1] < shots:
+        more = np.cumsum(rng.geometric(p, size)) + positions[-1]
+        positions = np.concatenate([positions, more])
+    return positions[positions < shots]
+
+
+def _mask(positions, words):
+    mask = np.zeros(words, dtype=np.uint64)
+    positions = positions.astype(np.uint64)
+    np.bitwise_or.at(mask, positions >> np.uint64(6),
+                     np.uint64(1) << (positions & np.uint64(63)))
+    return mask
+
+
+def popcount(words, shots=None):
+    """Number of set bits in a packed word array (only the first `shots`)."""
+    bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), bitorder='little')
+    if shots is not None:
+        bits = bits[:shots]
+    return int(bits.sum())
+
+
+def unpack(words, shots):
+    """Unpack (rows, words) packed shots into a (shots, rows) uint8 array."""
+    words = np.ascontiguousarray(np.atleast_2d(words))
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :shots].T.copy()
+
+
+class PauliFrameSampler:
+    """Samples measurement records of a Clifford circuit under Pauli noise.
+
+    `p` is the depolarizing probability applied after every gate (a random
+    non-identity 1- or 2-qubit Pauli), `p_measure` flips each measurement
+    result and `p_reset` applies X after each reset.
+    """
+
+    def __init__(self, qc, p=0.0, p_measure=0.0, p_reset=0.0, seed=None):
+        self.num_qubits = qc.num_qubits
+        self.num_clbits = qc.num_clbits
+        self.p = p
+        self.p_measure = p_measure
+        self.p_reset = p_reset
+        self.ops = self._compile(qc)
+        self.reference = self._reference_sample(seed)
+
+    @staticmethod
+    def _compile(qc):
+        ops = []
+        for inst in qc.data:
+            name = inst.operation.name
+            if getattr(inst.operation, 'condition', None) is not None:
+                raise ValueError(f"classically conditioned '{name}' is not supported")
+            qubits = tuple(qc.find_bit(q).index for q in inst.qubits)
+            if name == 'barrier':
+                continue
+            if name == 'measure':
+                ops.append((name, qubits, qc.find_bit(inst.clbits[0]).index, inst.operation))
+            elif name in _SINGLE or name in _TWO or name == 'reset':
+                ops.append((name, qubits, None, inst.operation))
+            else:
+                raise ValueError(f"'{name}' is not a supported Clifford operation")
+        return ops
+
+    def _reference_sample(self, seed):
+        """Measurement outcomes of one noiseless run (clbit-indexed array)."""
+        state = StabilizerState(QuantumCircuit(self.num_qubits))
+        if seed is not None:
+            state.seed(seed)
+        reference = np.zeros(self.num_clbits, dtype=np.uint8)
+        for name, qubits, clbit, operation in self.ops:
+            if name == 'measure':
+                outcome, state = state.measure(list(qubits))
+                reference[clbit] = int(outcome)
+            elif name == 'reset':
+                state = state.reset(list(qubits))
+            elif name != 'id':
+                state = state.evolve(operation, list(qubits))
+        return reference
+
+    def sample(self, shots, seed=None):
+        """Return packed measurement records of shape (num_clbits, words).
+
+        Bit k of word w in row c is clbit c of shot 64 * w + k.
+        """
+        rng = np.random.default_rng(seed)
+        words = (shots + 63) // 64
+        x = np.zeros((self.num_qubits, words), dtype=np.uint64)
+        z = np.empty((self.num_qubits, words), dtype=np.uint64)
+        for q in range(self.num_qubits):
+            z[q] = _random_words(rng, words)
+        records = np.zeros((self.num_clbits, words), dtype=np.uint64)
+        ones = ~np.uint64(0)
+
+        for name, qubits, clbit, _ in self.ops:
+            if name == 'measure':
+                q = qubits[0]
+                record = x[q].copy()
+                if self.p_measure:
+                    record ^= _mask(_error_positions(rng, self.p_measure, shots), words)
+                if self.reference[clbit]:
+                    record ^= ones
+                records[clbit] = record
+                z[q] = _random_words(rng, words)
+                continue
+            if name == 'reset':
+                q = qubits[0]
+                x[q] = 0
+                z[q] = _random_words(rng, words)
+                if self.p_reset:
+                    x[q] = _mask(_error_positions(rng, self.p_reset, shots), words)
+                continue
+
+            if name == 'h':
+                q = qubits[0]
+                x[q], z[q] = z[q].copy(), x[q].copy()
+            elif name in ('s', 'sdg'):
+                q = qubits[0]
+                z[q] ^= x[q]
+            elif name in ('sx', 'sxdg'):
+                q = qubits[0]
+                x[q] ^= z[q]
+            elif name == 'cx':
+                c, t = qubits
+                x[t] ^= x[c]
+                z[c] ^= z[t]
+            elif name == 'cz':
+                a, b = qubits
+                z[a] ^= x[b]
+                z[b] ^= x[a]
+            elif name == 'swap':
+                a, b = qubits
+                x[[a, b]] = x[[b, a]]
+                z[[a, b]] = z[[b, a]]
+
+            if self.p:
+                self._depolarize(rng, x, z, qubits, shots, words)
+
+        return records
+
+    def _depolarize(self, rng, x, z, qubits, shots, words):
+        positions = _error_positions(rng, self.p, shots)
+        if len(positions) == 0:
+            return
+        # Each Pauli is a bit pattern (x_0, z_0, x_1, z_1, ...); 0 is identity
+        paulis = rng.integers(1, 4 ** len(qubits), len(positions))
+        for i, q in enumerate(qubits):
+            x[q] ^= _mask(positions[(paulis >> (2 * i)) & 1 == 1], words)
+            z[q] ^= _mask(positions[(paulis >> (2 * i + 1)) & 1 == 1], words)
+
+    def sample_bits(self, shots, seed=None):
+        """Measurement records as a (shots, num_clbits) uint8 array."""
+        return unpack(self.sample(shots, seed), shots)
+
+    def get_counts(self, shots, seed=None):
+        """Counts dictionary keyed like Aer output for a single register."""
+        bits = self.sample_bits(shots, seed)
+        rows, counts = np.unique(bits[:, ::-1], axis=0, return_counts=True)
+        return {''.join(map(str, row)): int(c) for row, c in zip(rows, counts)}
@@ -0,0 +1,123 @@
+"""Period estimation from order-finding samples with adaptive shot counts.
+
+Every measured integer y (y / 2^t ~ s / r) is expanded as a continued
+fraction, all samples at once on numpy arrays, and its last convergent
+denominator <= N is kept. For noise-free samples that denominator is
+r / gcd(s, r), a divisor of r, so the LCM of a few of them is r itself.
+The LCM is verified with a^L = 1 mod N and reduced to the exact order by
+dividing out primes while a^(L / p) = 1 still holds.
+
+`estimate_period` samples in small batches and stops once the period is
+verified and enough samples agree with it, instead of taking a fixed
+1024 shots.
+"""
+from math import lcm
+
+import numpy as np
+
+from csci769 import execution, store, trace
+
+
+def convergent_denominators(samples, precision, N):
+    """Last continued-fraction convergent denominator <= N of each y / 2^precision."""
+    h = np.array(samples, dtype=np.int64)
+    k = np.full_like(h, 1 << precision)
+    q_prev, q = np.ones_like(h), np.zeros_like(h)  # q_{-2}, q_{-1}
+    best = np.ones_like(h)
+    active = np.ones(h.shape, dtype=bool)
+    while active.any():
+        a = np.where(active, h // np.where(k > 0, k, 1), 0)
+        q_next = a * q + q_prev
+        active &= q_next <= N
+        best = np.where(active, q_next, best)
+        q_prev, q = q, q_next
+        h, k = k, h - a * k
+        active &= k > 0
+    return best
+
+
+def _prime_factors(n):
+    factors, p = [], 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def reduce_to_order(a, N, L):
+    """The order of a, given any multiple L of it."""
+    for p in _prime_factors(L):
+        while L % p == 0 and pow(a, L // p, N) == 1:
+            L //= p
+    return L
+
+
+def combine(a, N, denominators):
+    """Period from the LCM of the observed denominators.
+
+    Denominators are combined most frequent first; one that would push the
+    LCM past N cannot divide the period and is skipped as noise. Returns
+    (period or None, confidence), where confidence is the fraction of
+    samples whose denominator divides the period.
+    """
+    values, counts = np.unique(np.asarray(denominators), return_counts=True)
+    L = 1
+    for d in values[np.argsort(-counts, kind='stable')]:
+        candidate = lcm(L, int(d))
+        if candidate <= N:
+            L = candidate
+    if pow(a, L, N) != 1:
+        return None, 0.0
+    r = reduce_to_order(a, N, L)
+    agree = counts[r % values == 0].sum()
+    return r, float(agree / counts.sum())
+
+
+def estimate_period(a, N, qc, precision, backend=None, batch=8, max_shots=1024,
+                    min_agree=2, seed=None, cache=True, **run_options):
+    """Sample `qc` in batches until the period of a mod N is confirmed.
+
+    `qc` measures y into clbits 0..precision-1. Sampling stops once the
+    combined period is verified and at least `min_agree` samples divide it,
+    or after `max_shots`. With a seed every batch is reproducible, and
+    unless `cache` is False it is served from `csci769.store` on reruns.
+    Returns a dict with period, confidence, shots and the measured samples.
+    """
+    if backend is None:
+        backend = execution.get_backend()
+    rng = np.random.default_rng(seed)
+    samples = np.empty(0, dtype=np.int64)
+    denominators = np.empty(0, dtype=np.int64)
+    period, confidence = None, 0.0
+    while len(samples) < max_shots:
+        shots = min(batch, max_shots - len(samples))
+        batch_seed = int(rng.integers(2**31)) if seed is not None else None
+        if cache:
+            memory = store.run(qc, backend, shots=shots, seed=batch_seed,
+                               **run_options).get_memory()
+        else:
+            if batch_seed is not None:
+                run_options['seed_simulator'] = batch_seed
+            compiled = execution.transpile(qc, backend)
+            with trace.span('simulate', backend=backend.name, shots=shots):
+                memory = backend.run(compiled, shots=shots, memory=True,
+                                     **run_options).result().get_memory()
+        with trace.span('postprocess', shots=shots):
+            new = np.array([int(bits.replace(' ', ''), 2) for bits in memory], dtype=np.int64)
+            samples = np.concatenate([samples, new])
+            denominators = np.concatenate([denominators,
+                                           convergent_denominators(new, precision, N)])
+            period, confidence = combine(a, N, denominators)
+        if period is not None and confidence * len(samples) >= min_agree:
+            break
+    return {
+        'period': period,
+        'confidence': confidence,
+        'shots': len(samples),
+        'samples': samples,
+    }
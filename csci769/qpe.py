@@ -0,0 +1,84 @@
+"""Controlled powers of unitaries for phase estimation.
+
+QPE needs controlled-U^(2^i) for every counting qubit. Repeating the
+controlled gate 2^i times makes the circuit exponential in the number of
+counting qubits. Rotation-type gates are instead emitted once with the
+angle scaled by the power. General unitaries are raised to 2^k by repeated
+squaring, and the squares are cached per matrix.
+"""
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterExpression
+from qiskit.circuit.library import QFT, PhaseGate, RXGate, RYGate, RZGate, UnitaryGate
+
+# Gates whose k-th power is the same gate with k times the angle
+_ANGLE_GATES = {'p': PhaseGate, 'rx': RXGate, 'ry': RYGate, 'rz': RZGate}
+
+_squares = {}
+
+
+def _matrix_key(matrix):
+    return matrix.shape, matrix.tobytes()
+
+
+def power_of_two(matrix, k):
+    """U^(2^k), computed by repeated squaring and cached per matrix."""
+    matrix = np.ascontiguousarray(matrix, dtype=complex)
+    squares = _squares.setdefault(_matrix_key(matrix), [matrix])
+    while len(squares) <= k:
+        squares.append(squares[-1] @ squares[-1])
+    return squares[k]
+
+
+def matrix_power(matrix, power):
+    """U^power as a product of cached power-of-two squares."""
+    matrix = np.asarray(matrix, dtype=complex)
+    result = np.eye(matrix.shape[0], dtype=complex)
+    k = 0
+    while power:
+        if power & 1:
+            result = power_of_two(matrix, k) @ result
+        power >>= 1
+        k += 1
+    return result
+
+
+def power_gate(gate, power):
+    """A single gate equal to gate^power."""
+    if gate.name in _ANGLE_GATES:
+        angle = gate.params[0] * power
+        if not isinstance(angle, ParameterExpression):
+            # Angles only matter modulo 4 pi (2 pi for the phase gate), and
+            # keeping them small preserves precision for large powers
+            angle = np.mod(float(angle), 2 * np.pi if gate.name == 'p' else 4 * np.pi)
+        return _ANGLE_GATES[gate.name](angle)
+    matrix = gate.to_matrix() if hasattr(gate, 'to_matrix') else np.asarray(gate)
+    return UnitaryGate(matrix_power(matrix, power), label=f'U^{power}')
+
+
+def controlled_power(qc, gate, power, control, targets):
+    """Append controlled-(gate^power) with one gate instead of `power` copies."""
+    if gate.name == 'p':
+        qc.cp(power_gate(gate, power).params[0], control, targets[0])
+    else:
+        qc.append(power_gate(gate, power).control(1), [control] + list(targets))
+    return qc
+
+
+def qpe_circuit(gate, n_count, prepare_eigenstate=None):
+    """Phase estimation of `gate` with `n_count` counting qubits.
+
+    `prepare_eigenstate(qc, targets)` prepares the target register; the
+    counting register is measured into clbits 0..n_count-1.
+    """
+    n_state = gate.num_qubits
+    qc = QuantumCircuit(n_count + n_state, n_count)
+    targets = list(range(n_count, n_count + n_state))
+    if prepare_eigenstate is not None:
+        prepare_eigenstate(qc, targets)
+    qc.h(range(n_count))
+    for i in range(n_count):
+        controlled_power(qc, gate, 2 ** i, i, targets)
+    qc.append(QFT(n_count).inverse(), range(n_count))
+    qc.measure(range(n_count), range(n_count))
+    return qc
@@ -0,0 +1,260 @@
+"""Vectorized syndrome processing and decoding for the bit-flip repetition code.
+
+Shot data is kept as NumPy arrays: data bits are (shots, d) and syndrome
+history is (shots, rounds, checks) with check i comparing data qubits i and
+i + 1. No per-shot Python loops are involved.
+"""
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+from csci769.sampling import memory_to_array
+
+
+def repetition_code_circuit(distance, rounds, logical=0):
+    """Distance-d, r-round bit-flip repetition code memory experiment.
+
+    Data qubits come first, then the d - 1 ancillas. Clbits are laid out as
+    the `data_bits` register followed by one `round{r}` register per round, so
+    data bits are clbits 0..d-1 and round r, check i is clbit
+    d + (d - 1) * r + i, which is the layout `analyze_memory` expects.
+    """
+    data = QuantumRegister(distance, 'data')
+    ancilla = QuantumRegister(distance - 1, 'ancilla')
+    data_bits = ClassicalRegister(distance, 'data_bits')
+    round_bits = [ClassicalRegister(distance - 1, f'round{r}') for r in range(rounds)]
+    qc = QuantumCircuit(data, ancilla, data_bits, *round_bits)
+
+    if logical:
+        qc.x(data)
+    for r in range(rounds):
+        if r:
+            qc.reset(ancilla)
+        for i in range(distance - 1):
+            qc.cx(data[i], ancilla[i])
+            qc.cx(data[i + 1], ancilla[i])
+        qc.measure(ancilla, round_bits[r])
+    qc.measure(data, data_bits)
+    return qc
+
+
+def syndrome_array(bits, num_rounds, num_checks, offset):
+    """Slice per-round syndrome bits out of a (shots, num_clbits) array.
+
+    Round r, check i is expected in clbit offset + num_checks * r + i.
+    """
+    end = offset + num_rounds * num_checks
+    return bits[:, offset:end].reshape(bits.shape[0], num_rounds, num_checks)
+
+
+def data_syndrome(data):
+    """Syndrome implied by the final data measurement, shape (shots, d - 1)."""
+    return data[:, :-1] ^ data[:, 1:]
+
+
+def detection_events(syndromes, final=None):
+    """XOR consecutive syndrome rounds.
+
+    The first round is compared against the all-zero syndrome of a fresh
+    code state. If `final` (the data-derived syndrome) is given it is
+    appended as one more round. Returns a (shots, rounds[+1], checks) array.
+    """
+    if final is not None:
+        syndromes = np.concatenate([syndromes, final[:, None, :]], axis=1)
+    events = syndromes.copy()
+    events[:, 1:] ^= syndromes[:, :-1]
+    return events
+
+
+def _run_minimum(labels, region, axis):
+    """Replace each label by the minimum over its run of region cells along `axis`."""
+    labels = np.ascontiguousarray(np.moveaxis(labels, axis, -1))
+    region = np.moveaxis(region, axis, -1)
+    # Every cell starts a segment unless it continues a run of the region
+    starts = np.ones(labels.shape, dtype=bool)
+    starts[..., 1:] = ~(region[..., 1:] & region[..., :-1])
+    starts = starts.ravel()
+    minima = np.minimum.reduceat(labels.ravel(), np.flatnonzero(starts))
+    labels = minima[np.cumsum(starts, dtype=np.int32) - 1].reshape(labels.shape)
+    return np.moveaxis(labels, -1, axis)
+
+
+def _clusters(region):
+    """Connected components of a (shots, rounds, checks) region.
+
+    Every cell of a component is labelled with the smallest flat index in
+    it; cells outside the region get region.size. Labels are propagated as
+    run minima along time and space in turn, with pointer jumping, until
+    nothing changes.
+    """
+    index = np.arange(region.size, dtype=np.int32).reshape(region.shape)
+    labels = np.where(region, index, region.size)
+    while True:
+        previous = labels
+        for axis in (1, 2):
+            labels = _run_minimum(labels, region, axis)
+            # Pointer jumping: a label is a cell of the same component, so
+            # take that cell's label, which may already be smaller
+            flat = np.append(labels.ravel(), region.size)
+            labels = flat[flat[labels]]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _dilate(cells):
+    """Grow cells by one step in time and space (not across shots)."""
+    grown = cells.copy()
+    grown[:, 1:] |= cells[:, :-1]
+    grown[:, :-1] |= cells[:, 1:]
+    grown[:, :, 1:] |= cells[:, :, :-1]
+    grown[:, :, :-1] |= cells[:, :, 1:]
+    return grown
+
+
+def _boundary_flips(events):
+    """Union-find decoding of one block of shots; see `decode_events`."""
+    shots, rounds, checks = events.shape
+    flips = np.zeros(shots, dtype=np.uint8)
+    active = np.arange(shots)
+    region = events.copy()
+    # Rounds in which a cluster has grown past check 0 or check d - 2
+    # into the boundary
+    left_edge = np.zeros((shots, rounds), dtype=bool)
+    right_edge = np.zeros((shots, rounds), dtype=bool)
+    while len(active):
+        labels = _clusters(region)
+        size = region.size + 1
+        event_labels = labels[events]
+        parity = np.bincount(event_labels, minlength=size) & 1
+        left = np.bincount(labels[:, :, 0][left_edge], minlength=size) > 0
+        right = np.bincount(labels[:, :, -1][right_edge], minlength=size) > 0
+        grow = ((parity == 1) & ~left & ~right)[labels]
+
+        # An odd cluster on the left boundary sends one chain across data
+        # qubit 0; one touching both ends uses the side nearer its events
+        columns = np.nonzero(events)[2]
+        lowest = np.full(size, checks)
+        highest = np.full(size, -1)
+        np.minimum.at(lowest, event_labels, columns)
+        np.maximum.at(highest, event_labels, columns)
+        crossing = (parity == 1) & left & (~right | (lowest < checks - 1 - highest))
+        roots = np.flatnonzero(crossing[:-1])
+        shot_flips = np.bincount(roots // (rounds * checks), minlength=len(active)) & 1
+
+        pending = grow.any(axis=(1, 2))
+        flips[active[~pending]] = shot_flips[~pending]
+        active, events, grow = active[pending], events[pending], grow[pending]
+        region = region[pending] | _dilate(grow)
+        left_edge = left_edge[pending] | grow[:, :, 0]
+        right_edge = right_edge[pending] | grow[:, :, -1]
+    return flips
+
+
+def decode_events(events, block=4096):
+    """Decode detection events; 1 where the correction flips data qubit 0.
+
+    `events` is a (shots, rounds, checks) array from `detection_events`
+    that ends with the data-derived round. It is decoded with union-find
+    on the space-time graph: clusters of events with odd parity grow by
+    one step at a time and merge until every cluster holds an even number
+    of events or reaches a boundary (the end data qubits). Only the parity
+    of the corrections on data qubit 0 matters for the logical value, and
+    that is the parity of the odd clusters sent to the left boundary.
+
+    Each distinct event pattern is decoded once, `block` patterns at a
+    time, and shots without events are skipped. The work per pattern
+    grows with rounds x checks: about 70 us for 100 rounds of d = 3 with
+    random syndromes, and 250 us for d = r = 25 at p = 0.01.
+    """
+    events = np.asarray(events, dtype=bool)
+    flips = np.zeros(len(events), dtype=np.uint8)
+    active = np.flatnonzero(events.any(axis=(1, 2)))
+    if not len(active):
+        return flips
+    packed = np.packbits(events[active].reshape(len(active), -1), axis=1)
+    patterns, first, inverse = np.unique(packed, axis=0, return_index=True,
+                                         return_inverse=True)
+    pattern_flips = np.zeros(len(patterns), dtype=np.uint8)
+    for start in range(0, len(patterns), block):
+        shots = active[first[start:start + block]]
+        pattern_flips[start:start + block] = _boundary_flips(events[shots])
+    flips[active] = pattern_flips[inverse.ravel()]
+    return flips
+
+
+def decode(data, syndromes=None):
+    """Decode the logical value of every shot.
+
+    With the (shots, rounds, checks) `syndromes` history the detection
+    events, closed by the syndrome of the final data, are decoded with
+    `decode_events`, so measurement errors and errors between rounds are
+    told apart. Without it only the final data bits are used: on a chain
+    the syndrome fixes the error up to a global flip, and the
+    minimum-weight choice is a majority vote. Returns (corrected_data,
+    logical), where corrected_data is the codeword of the decoded
+    logical value.
+    """
+    d = data.shape[1]
+    if syndromes is not None:
+        events = detection_events(syndromes, data_syndrome(data))
+        logical = data[:, 0] ^ decode_events(events).astype(data.dtype)
+    else:
+        logical = (data.sum(axis=1, dtype=np.int64) * 2 > d).astype(data.dtype)
+    corrected = np.repeat(logical[:, None], d, axis=1)
+    return corrected, logical
+
+
+def logical_error_rate(data, expected=0, syndromes=None):
+    """Fraction of shots whose decoded logical value differs from `expected`."""
+    _, logical = decode(data, syndromes)
+    return float(np.mean(logical != expected))
+
+
+def _bit_values(bits):
+    """Integer value of every row of a (..., width) bit array, bit k = column k."""
+    width = bits.shape[-1]
+    if width > 63:
+        raise ValueError(f"cannot pack {width} bits into an int64")
+    return bits.astype(np.int64) @ (np.int64(1) << np.arange(width, dtype=np.int64))
+
+
+def most_common_syndromes(syndromes):
+    """Most frequent syndrome value across rounds for every shot.
+
+    Each shot's values are sorted and the longest run wins; ties go to the
+    smallest value.
+    """
+    values = np.sort(_bit_values(syndromes), axis=1)
+    position = np.arange(values.shape[1])
+    starts = np.ones(values.shape, dtype=bool)
+    starts[:, 1:] = values[:, 1:] != values[:, :-1]
+    run_start = np.maximum.accumulate(np.where(starts, position, 0), axis=1)
+    best = (position - run_start).argmax(axis=1)
+    return values[np.arange(len(values)), best]
+
+
+def value_counts(values, width):
+    """Counts dictionary of integer values formatted as width-bit strings."""
+    unique, counts = np.unique(values, return_counts=True)
+    return {format(int(v), f'0{width}b'): int(c) for v, c in zip(unique, counts)}
+
+
+def analyze_memory(memory, num_rounds, distance=3, expected=0, use_syndromes=True):
+    """Full analysis of repetition-code shot memory.
+
+    Data bits are clbits 0..d-1 and round syndromes follow them. Returns a
+    dict with data counts, per-shot most common syndrome counts, the
+    per-round detection event rate and the decoded logical error rate.
+    With use_syndromes=False the logical value is a majority vote over the
+    final data, for circuits whose syndromes do not measure the parities.
+    """
+    bits = memory_to_array(memory) if not isinstance(memory, np.ndarray) else memory
+    data = bits[:, :distance]
+    syndromes = syndrome_array(bits, num_rounds, distance - 1, distance)
+    events = detection_events(syndromes, data_syndrome(data))
+    return {
+        'data_counts': value_counts(_bit_values(data), distance),
+        'syndrome_counts': value_counts(most_common_syndromes(syndromes), distance - 1),
+        'detection_rate': events.mean(axis=(0, 2)),
+        'logical_error_rate': logical_error_rate(data, expected,
+                                                 syndromes if use_syndromes else None),
+    }
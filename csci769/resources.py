@@ -0,0 +1,94 @@
+"""Vectorized surface-code resource estimates.
+
+Uses the scaling model from HW3/4a-b.py,
+
+    pL = A * (p / pth) ** ((d + 1) / 2),    Nq = c * d ** 2,
+
+broadcast over whole grids of p, pth, target pL and d instead of one point
+at a time. Grid results are cached, so repeated queries with the same axes
+are free.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+def logical_error_rate(d, p, pth, A=1.0):
+    """Logical error rate for any broadcastable d, p, pth."""
+    d, p, pth = np.asarray(d, dtype=float), np.asarray(p, dtype=float), np.asarray(pth, dtype=float)
+    return A * (p / pth) ** ((d + 1) / 2)
+
+
+def physical_qubits(d, c=2):
+    """Physical qubits per logical qubit."""
+    return c * np.asarray(d) ** 2
+
+
+def correctable_errors(d):
+    """Number of errors a distance-d code corrects."""
+    return (np.asarray(d) - 1) // 2
+
+
+def minimum_distance(p, pth, target, A=1.0):
+    """Smallest odd d >= 3 with pL <= target, in closed form.
+
+    Solving the scaling model for d gives d >= 2 log(target / A) / log(p / pth) - 1,
+    which is rounded up to the next odd integer. Points with p >= pth have
+    no solution and get -1.
+    """
+    p, pth, target = np.broadcast_arrays(np.asarray(p, dtype=float),
+                                         np.asarray(pth, dtype=float),
+                                         np.asarray(target, dtype=float))
+    below = p < pth
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d_min = 2 * np.log(target / A) / np.log(p / pth) - 1
+    # Guard against d_min landing a hair above an odd integer through rounding
+    d_min = np.where(below, d_min - 1e-9, 0.0)
+    d = 2 * np.ceil((d_min - 1) / 2) + 1
+    d = np.maximum(d, 3)
+    return np.where(below, d, -1).astype(np.int64)
+
+
+@lru_cache(maxsize=64)
+def _grid(target, p, pth, A, c):
+    TARGET, P, PTH = np.meshgrid(np.array(target), np.array(p), np.array(pth), indexing='ij')
+    d = minimum_distance(P, PTH, TARGET, A)
+    feasible = d > 0
+    table = {
+        'target': TARGET.ravel(),
+        'p': P.ravel(),
+        'pth': PTH.ravel(),
+        'feasible': feasible.ravel(),
+        'd': d.ravel(),
+        'Nq': np.where(feasible, physical_qubits(d, c), -1).ravel(),
+        'correctable': np.where(feasible, correctable_errors(d), -1).ravel(),
+        'pL': np.where(feasible, logical_error_rate(np.maximum(d, 0), P, PTH, A), np.nan).ravel(),
+    }
+    for column in table.values():
+        column.setflags(write=False)
+    return table
+
+
+def _axis(values):
+    return tuple(float(v) for v in np.atleast_1d(values).ravel())
+
+
+def estimate(target, p, pth, A=1.0, c=2):
+    """Resource table over the full grid target x p x pth.
+
+    Returns a columnar dict of equal-length 1D arrays: target, p, pth,
+    feasible, d, Nq, correctable and pL, ordered with target varying
+    slowest and pth fastest. Infeasible points (p >= pth) have d = Nq = -1
+    and pL = nan. The arrays are shared with the cache and are read-only.
+    """
+    return _grid(_axis(target), _axis(p), _axis(pth), float(A), float(c))
+
+
+def distance_sweep(distances, p, pth, A=1.0):
+    """pL surface of shape (len(p), len(distances))."""
+    return logical_error_rate(np.asarray(distances)[None, :], np.atleast_1d(p)[:, None], pth, A)
+
+
+def cache_info():
+    """Hit/miss statistics of the grid cache."""
+    return _grid.cache_info()
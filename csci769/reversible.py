@@ -0,0 +1,227 @@
+"""Bit-level simulator for circuits built only from classical reversible gates.
+
+Circuits made of X, CX, CCX, MCX and SWAP gates (and controlled versions of
+sub-circuits made of those) only permute computational basis states, so they
+can be evaluated on bits instead of a 2^n amplitude statevector.
+"""
+import numpy as np
+from qiskit.circuit import ControlledGate
+
+_IGNORED = {'barrier', 'id', 'delay'}
+
+
+def _compile(operation, qubits, controls, ops):
+    """Append the bit operations for `operation` acting on `qubits`."""
+    name = operation.name
+    if getattr(operation, 'condition', None) is not None:
+        raise ValueError(f"classically conditioned '{name}' is not supported")
+    if name in _IGNORED:
+        return
+    if name == 'x':
+        ops.append(('x', (qubits[0],), controls))
+    elif name == 'swap':
+        ops.append(('swap', (qubits[0], qubits[1]), controls))
+    elif name == 'measure':
+        raise ValueError("measurement inside a gate definition is not supported")
+    elif isinstance(operation, ControlledGate):
+        num_ctrl = operation.num_ctrl_qubits
+        ctrl_state = operation.ctrl_state
+        new_controls = controls + tuple(
+            (qubits[i], (ctrl_state >> i) & 1) for i in range(num_ctrl)
+        )
+        _compile(operation.base_gate, qubits[num_ctrl:], new_controls, ops)
+    elif operation.definition is not None:
+        definition = operation.definition
+        if definition.global_phase:
+            raise ValueError(f"'{name}' has a global phase")
+        index = {bit: qubits[i] for i, bit in enumerate(definition.qubits)}
+        for inst in definition.data:
+            _compile(inst.operation, [index[q] for q in inst.qubits], controls, ops)
+    else:
+        raise ValueError(f"'{name}' is not a classical reversible gate")
+
+
+def compile_circuit(qc):
+    """Lower a circuit into a list of bit operations.
+
+    Each entry is (kind, targets, controls) where kind is 'x', 'swap',
+    'reset' or 'measure' and controls is a tuple of (qubit, value) pairs.
+    Raises ValueError if the circuit is not a classical permutation.
+    """
+    ops = []
+    for inst in qc.data:
+        qubits = [qc.find_bit(q).index for q in inst.qubits]
+        name = inst.operation.name
+        if name == 'measure':
+            ops.append(('measure', (qubits[0], qc.find_bit(inst.clbits[0]).index), ()))
+        elif name == 'reset':
+            ops.append(('reset', (qubits[0],), ()))
+        else:
+            _compile(inst.operation, qubits, (), ops)
+    return ops
+
+
+def is_classical(qc):
+    """Return True if the circuit only permutes computational basis states."""
+    try:
+        compile_circuit(qc)
+    except ValueError:
+        return False
+    return True
+
+
+def simulate(qc, initial=0, ops=None):
+    """Run the circuit on one basis state in O(gates).
+
+    `initial` is an integer with qubit 0 as its least significant bit.
+    Returns (qubit_state, clbit_state) as integers in the same convention.
+    """
+    if ops is None:
+        ops = compile_circuit(qc)
+    state = int(initial)
+    clbits = 0
+    for kind, targets, controls in ops:
+        if kind == 'measure':
+            q, c = targets
+            clbits = (clbits & ~(1 << c)) | (((state >> q) & 1) << c)
+            continue
+        if kind == 'reset':
+            state &= ~(1 << targets[0])
+            continue
+        if any(((state >> q) & 1) != v for q, v in controls):
+            continue
+        if kind == 'x':
+            state ^= 1 << targets[0]
+        else:
+            a, b = targets
+            if ((state >> a) ^ (state >> b)) & 1:
+                state ^= (1 << a) | (1 << b)
+    return state, clbits
+
+
+def simulate_batch(qc, inputs, ops=None):
+    """Run the circuit on many basis states at once.
+
+    `inputs` is a (batch, num_qubits) array of bits. Every gate is one
+    vectorized NumPy operation over the batch. Returns (qubit_bits,
+    clbit_bits) arrays of shape (batch, num_qubits) and (batch, num_clbits).
+    """
+    if ops is None:
+        ops = compile_circuit(qc)
+    # Work on (bits, batch) so every gate touches contiguous rows
+    state = np.ascontiguousarray(np.asarray(inputs, dtype=np.uint8).T)
+    clbits = np.zeros((qc.num_clbits, state.shape[1]), dtype=np.uint8)
+    for kind, targets, controls in ops:
+        if kind == 'measure':
+            q, c = targets
+            clbits[c] = state[q]
+            continue
+        if kind == 'reset':
+            state[targets[0]] = 0
+            continue
+        mask = None
+        for q, v in controls:
+            bit = state[q] if v else state[q] ^ 1
+            mask = bit.copy() if mask is None else mask & bit
+        if kind == 'x':
+            t = targets[0]
+            state[t] ^= 1 if mask is None else mask
+        else:
+            a, b = targets
+            diff = state[a] ^ state[b]
+            if mask is not None:
+                diff &= mask
+            state[a] ^= diff
+            state[b] ^= diff
+    return state.T, clbits.T
+
+
+def _basis_columns(n):
+    """Packed uint64 columns holding bit q of every input index 0..2^n-1."""
+    size = 1 << n
+    words = max(1, size // 64)
+    index = np.arange(size, dtype=np.uint64)
+    columns = []
+    for q in range(n):
+        bits = ((index >> np.uint64(q)) & np.uint64(1)).astype(np.uint8)
+        packed = np.zeros(words * 8, dtype=np.uint8)
+        packed[:(size + 7) // 8] = np.packbits(bits, bitorder='little')
+        columns.append(packed.view(np.uint64))
+    return columns, words
+
+
+def _unpack_columns(columns, size):
+    """Combine packed bit columns back into one integer per input index."""
+    out = np.zeros(size, dtype=np.uint64)
+    for q, column in enumerate(columns):
+        bits = np.unpackbits(column.view(np.uint8), bitorder='little')[:size]
+        out |= bits.astype(np.uint64) << np.uint64(q)
+    return out
+
+
+def truth_table(qc, ops=None, return_clbits=False):
+    """Evaluate the circuit on all 2^n basis inputs in one vectorized pass.
+
+    Returns an array `table` of length 2^n where `table[i]` is the output
+    basis state for input `i`. With `return_clbits=True` the measured
+    classical bits for every input are returned as a second array.
+    """
+    if ops is None:
+        ops = compile_circuit(qc)
+    n = qc.num_qubits
+    size = 1 << n
+    columns, words = _basis_columns(n)
+    ones = np.full(words, np.iinfo(np.uint64).max, dtype=np.uint64)
+    zeros = np.zeros(words, dtype=np.uint64)
+    measured = [zeros] * qc.num_clbits
+
+    for kind, targets, controls in ops:
+        if kind == 'measure':
+            q, c = targets
+            measured[c] = columns[q].copy()
+            continue
+        if kind == 'reset':
+            columns[targets[0]] = zeros.copy()
+            continue
+        mask = None
+        for q, v in controls:
+            bit = columns[q] if v else ~columns[q]
+            mask = bit.copy() if mask is None else mask & bit
+        if kind == 'x':
+            t = targets[0]
+            columns[t] = columns[t] ^ (ones if mask is None else mask)
+        else:
+            a, b = targets
+            if mask is None:
+                columns[a], columns[b] = columns[b], columns[a]
+            else:
+                diff = (columns[a] ^ columns[b]) & mask
+                columns[a] = columns[a] ^ diff
+                columns[b] = columns[b] ^ diff
+
+    table = _unpack_columns(columns, size)
+    if return_clbits:
+        return table, _unpack_columns(measured, size)
+    return table
+
+
+def probabilities_dict(qc, initial=0):
+    """Deterministic replacement for Statevector.probabilities_dict()."""
+    state, _ = simulate(qc, initial)
+    return {format(state, f'0{qc.num_qubits}b'): 1.0}
+
+
+def format_clbits(qc, clbits):
+    """Format a classical bit integer the way Aer labels its counts."""
+    labels = []
+    for creg in reversed(qc.cregs):
+        labels.append(''.join(
+            str((clbits >> qc.find_bit(bit).index) & 1) for bit in reversed(creg)
+        ))
+    return ' '.join(labels)
+
+
+def get_counts(qc, shots=1024, initial=0):
+    """Counts dictionary matching AerSimulator output for a classical circuit."""
+    _, clbits = simulate(qc, initial)
+    return {format_clbits(qc, clbits): shots}
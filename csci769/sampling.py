@@ -0,0 +1,100 @@
+"""Batched sampling helpers that return per-shot outcomes as NumPy arrays."""
+import numpy as np
+from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
+from qiskit_aer import Aer
+
+
+def memory_to_array(memory):
+    """Convert Aer memory strings into a (shots, num_clbits) uint8 array.
+
+    Column j holds classical bit j, so the rightmost character of each
+    string ends up in column 0. Spaces between registers are dropped.
+    """
+    if len(memory) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    joined = ''.join(memory).replace(' ', '')
+    width = len(joined) // len(memory)
+    bits = np.frombuffer(joined.encode('ascii'), dtype=np.uint8) - ord('0')
+    return bits.reshape(len(memory), width)[:, ::-1]
+
+
+def bits_to_int(bits):
+    """Pack the rows of a (shots, num_clbits) bit array into integers.
+
+    Rows wider than 64 bits do not fit a uint64 and raise ValueError.
+    """
+    if bits.shape[1] > 64:
+        raise ValueError(f"cannot pack {bits.shape[1]} clbits into a uint64")
+    weights = np.left_shift(np.uint64(1), np.arange(bits.shape[1], dtype=np.uint64))
+    return bits.astype(np.uint64) @ weights
+
+
+def run_batched(circuits, backend=None, shots=1, seed=None):
+    """Submit all circuits in one backend call.
+
+    Returns an array of shape (len(circuits), shots) holding the measured
+    classical register of every shot as an integer.
+    """
+    if backend is None:
+        backend = Aer.get_backend('qasm_simulator')
+    options = {'shots': shots, 'memory': True}
+    if seed is not None:
+        options['seed_simulator'] = seed
+    result = backend.run(list(circuits), **options).result()
+    return np.array([
+        bits_to_int(memory_to_array(result.get_memory(i)))
+        for i in range(len(circuits))
+    ])
+
+
+def random_x_circuit(p=0.5):
+    """One circuit whose X gate is applied with probability p on every shot.
+
+    A coin qubit prepared with Ry(2 asin(sqrt(p))) is measured into the
+    `coin` register and the X on the data qubit is conditioned on it.
+    """
+    data = QuantumRegister(1, 'q')
+    coin = QuantumRegister(1, 'coin')
+    coin_bit = ClassicalRegister(1, 'applied')
+    result = ClassicalRegister(1, 'c')
+    qc = QuantumCircuit(data, coin, result, coin_bit)
+    qc.ry(2 * np.arcsin(np.sqrt(p)), coin[0])
+    qc.measure(coin[0], coin_bit[0])
+    with qc.if_test((coin_bit[0], 1)):
+        qc.x(data[0])
+    qc.measure(data[0], result[0])
+    return qc
+
+
+def random_x_trials(num_trials, p=0.5, backend=None, seed=None, batched_circuits=False):
+    """Run `num_trials` independent random-X trials.
+
+    By default a single circuit is run with `num_trials` shots and the X
+    decision is randomized per shot on the simulator. With
+    `batched_circuits=True` one single-shot circuit per trial is built and
+    all of them are submitted in one call instead.
+
+    Returns (applied, outcomes) as uint8 arrays of length num_trials.
+    """
+    if backend is None:
+        backend = Aer.get_backend('qasm_simulator')
+    if batched_circuits:
+        rng = np.random.default_rng(seed)
+        applied = (rng.random(num_trials) < p).astype(np.uint8)
+        circuits = []
+        for apply_x in applied:
+            qc = QuantumCircuit(1, 1)
+            if apply_x:
+                qc.x(0)
+            qc.measure(0, 0)
+            circuits.append(qc)
+        outcomes = run_batched(circuits, backend, shots=1, seed=seed)[:, 0]
+        return applied, outcomes.astype(np.uint8)
+
+    options = {'shots': num_trials, 'memory': True}
+    if seed is not None:
+        options['seed_simulator'] = seed
+    qc = random_x_circuit(p)
+    memory = backend.run(qc, **options).result().get_memory()
+    bits = memory_to_array(memory)
+    return bits[:, 1].copy(), bits[:, 0].copy()
@@ -0,0 +1,144 @@
+"""Controlled modular multiplication for Shor's algorithm.
+
+The controlled-U^(2^q) blocks of period finding multiply the work register
+by a^(2^q) mod N. Instead of repeating the U = "multiply by a" circuit 2^q
+times, the block is built directly from the permutation x -> a^power x mod N
+(identity on x >= N). Since a^r = 1 mod N for the multiplicative order r,
+the power is first reduced mod r, so there are at most r distinct blocks.
+They are cached by (a, power mod r, N, width).
+
+When the permutation only relabels qubits (a = 2^k with N = 2^n - 1, as
+in the homework's N = 15, a = 2) it is emitted as controlled SWAPs.
+Otherwise it becomes a controlled permutation matrix, which Aer applies
+natively as a unitary instruction.
+
+`semiclassical_circuit` is the one-control-qubit form of period finding:
+the inverse QFT is replaced by measuring the control after each power and
+classically conditioning the phase corrections of later steps on it. The
+circuit is n_input + 1 qubits wide whatever the counting precision.
+"""
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import UnitaryGate
+
+
+@lru_cache(maxsize=None)
+def multiplicative_order(a, N):
+    """Smallest r > 0 with a^r = 1 mod N."""
+    if gcd(a, N) != 1:
+        raise ValueError(f"a = {a} is not coprime to N = {N}")
+    r, value = 1, a % N
+    while value != 1:
+        value = value * a % N
+        r += 1
+    return r
+
+
+def modmul_permutation(a, N, num_qubits):
+    """Basis permutation x -> a x mod N on num_qubits qubits, fixing x >= N."""
+    x = np.arange(2 ** num_qubits)
+    return np.where(x < N, a * x % N, x)
+
+
+def _qubit_permutation(perm, num_qubits):
+    """Qubit images if `perm` just relabels qubits, else None."""
+    images = []
+    for j in range(num_qubits):
+        image = int(perm[1 << j])
+        if image & (image - 1) or image == 0:
+            return None
+        images.append(image.bit_length() - 1)
+    x = np.arange(len(perm))
+    relabeled = np.zeros_like(x)
+    for j, image in enumerate(images):
+        relabeled |= ((x >> j) & 1) << image
+    return images if np.array_equal(relabeled, perm) else None
+
+
+def _swap_circuit(images):
+    """Swaps sending qubit j to qubit images[j]."""
+    qc = QuantumCircuit(len(images))
+    content = list(range(len(images)))  # content[p]: original qubit now at p
+    for j, image in enumerate(images):
+        here = content.index(j)
+        if here != image:
+            qc.swap(here, image)
+            content[here], content[image] = content[image], content[here]
+    return qc
+
+
+@lru_cache(maxsize=None)
+def _controlled_block(a, power, N, num_qubits):
+    perm = modmul_permutation(pow(a, power, N), N, num_qubits)
+    images = _qubit_permutation(perm, num_qubits)
+    if images is not None:
+        gate = _swap_circuit(images).to_gate(label=f'{a}^{power} mod {N}')
+        return gate.control(1)
+    # Control is qubit 0 of the block: index = c + 2 x
+    dim = 2 ** num_qubits
+    columns = np.concatenate([2 * np.arange(dim), 2 * perm + 1])
+    rows = np.concatenate([2 * np.arange(dim), 2 * np.arange(dim) + 1])
+    matrix = np.zeros((2 * dim, 2 * dim))
+    matrix[columns, rows] = 1
+    return UnitaryGate(matrix, label=f'c-{a}^{power} mod {N}')
+
+
+def controlled_modmul(a, power, N, num_qubits=None):
+    """Controlled multiply-by-a^power mod N, or None if it is the identity.
+
+    The control is the first qubit of the returned gate.
+    """
+    if num_qubits is None:
+        num_qubits = N.bit_length()
+    power %= multiplicative_order(a, N)
+    if power == 0:
+        return None
+    return _controlled_block(a, power, N, num_qubits)
+
+
+def append_modexp(qc, a, N, counting, targets):
+    """Controlled-U^(2^q) from counting qubit q onto `targets` for every q."""
+    targets = list(targets)
+    for q, control in enumerate(counting):
+        gate = controlled_modmul(a, 2 ** q, N, len(targets))
+        if gate is not None:
+            qc.append(gate, [control] + targets)
+    return qc
+
+
+def semiclassical_circuit(a, N, n_count, num_qubits=None):
+    """Order finding with a single recycled control qubit.
+
+    Step b applies controlled-U^(2^(n_count - 1 - b)), rotates away the
+    phase contributed by the bits already measured and measures bit b of
+    the phase estimate into clbit b. The clbits read as an integer y with
+    y / 2^n_count ~ s / r, exactly like the full-register circuit.
+    """
+    if num_qubits is None:
+        num_qubits = N.bit_length()
+    control = QuantumRegister(1, 'control')
+    work = QuantumRegister(num_qubits, 'work')
+    bits = ClassicalRegister(n_count, 'c')
+    qc = QuantumCircuit(control, work, bits)
+    qc.x(work[0])
+    for b in range(n_count):
+        if b:
+            qc.reset(control)
+        qc.h(control)
+        gate = controlled_modmul(a, 2 ** (n_count - 1 - b), N, num_qubits)
+        if gate is not None:
+            qc.append(gate, [control[0]] + list(work))
+        for m in range(b):
+            with qc.if_test((bits[m], 1)):
+                qc.p(-np.pi / 2 ** (b - m), control)
+        qc.h(control)
+        qc.measure(control, bits[b])
+    return qc
+
+
+def cache_info():
+    """Hit/miss statistics of the controlled-block cache."""
+    return _controlled_block.cache_info()
@@ -0,0 +1,195 @@
+"""Content-addressed on-disk store of simulation results.
+
+A run is identified by the structural hash of the circuit (see
+`csci769.execution.structural_hash`), the backend name and configuration
+(its options, including any noise model), the run options, the shot count
+and the simulator seed. Its per-shot memory is stored once as a
+bit-packed (shots, ceil(clbits / 8)) uint8 array, and its counts as the
+packed unique outcomes plus an int64 count per outcome, all as .npy files
+that are memory-mapped on load. A hit costs one structural hash and no
+transpilation or simulation.
+
+Only seeded runs are stored; with seed=None the circuit is simulated fresh
+every time. The store lives in $CSCI769_STORE (default
+~/.cache/csci769/results); setting it to 'off' disables it. When it grows
+past `max_bytes` the least recently used entries are deleted. The store is
+scanned for that on a process's first write and then after every
+`max_bytes / 8` it writes, not on every miss.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from csci769 import execution, trace
+from csci769.sampling import memory_to_array
+
+max_bytes = 512 * 2**20
+
+# Bytes this process has saved since it last scanned the store for eviction
+_unscanned_bytes = None
+
+
+def store_dir():
+    """Directory of the store, or None if it is disabled."""
+    path = os.environ.get('CSCI769_STORE', os.path.join('~', '.cache', 'csci769', 'results'))
+    return None if path == 'off' else os.path.expanduser(path)
+
+
+def run_key(qc, backend, shots, seed, options):
+    """Hex key of one run."""
+    parts = [execution.structural_hash(qc), repr(execution._backend_key(backend)),
+             str(int(shots)), str(int(seed)),
+             repr(sorted((k, repr(v)) for k, v in options.items()))]
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+class StoredResult:
+    """Counts and memory of one stored run, in the format Aer returns them."""
+
+    def __init__(self, path):
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        self.path = path
+        self._memory = np.load(os.path.join(path, 'memory.npy'), mmap_mode='r')
+        self._outcomes = np.load(os.path.join(path, 'outcomes.npy'), mmap_mode='r')
+        self._counts = np.load(os.path.join(path, 'counts.npy'), mmap_mode='r')
+
+    def _format(self, packed):
+        """Aer bitstrings of packed rows: registers reversed, space separated."""
+        bits = np.unpackbits(np.asarray(packed), axis=1, count=self.meta['num_clbits'],
+                             bitorder='little')
+        # Clbit shown at every character position, -1 for the separators;
+        # reversing the clbits also reverses the order of the registers
+        order, start = [], 0
+        for size in self.meta['registers']:
+            order += [-1] + list(range(start, start + size))
+            start += size
+        order = np.array(order[1:][::-1])
+        chars = np.where(order >= 0, bits[:, order] + ord('0'), ord(' ')).astype(np.uint8)
+        return np.ascontiguousarray(chars).view(f'S{len(order)}').ravel().astype(str).tolist()
+
+    def memory_array(self):
+        """(shots, num_clbits) uint8 bit array, column j = clbit j."""
+        return np.unpackbits(self._memory, axis=1, count=self.meta['num_clbits'],
+                             bitorder='little')
+
+    def get_memory(self, experiment=None):
+        return self._format(self._memory)
+
+    def get_counts(self, experiment=None):
+        return dict(zip(self._format(self._outcomes), (int(c) for c in self._counts)))
+
+
+def _save(path, qc, memory, meta):
+    """Write one entry; returns its size in bytes, or 0 if another writer won."""
+    bits = memory_to_array(memory)
+    packed = np.packbits(bits, axis=1, bitorder='little')
+    outcomes, counts = np.unique(packed, axis=0, return_counts=True)
+    tmp = tempfile.mkdtemp(suffix='.tmp', dir=os.path.dirname(path))
+    np.save(os.path.join(tmp, 'memory.npy'), packed)
+    np.save(os.path.join(tmp, 'outcomes.npy'), outcomes)
+    np.save(os.path.join(tmp, 'counts.npy'), counts.astype(np.int64))
+    registers = [reg.size for reg in qc.cregs]
+    if sum(registers) != qc.num_clbits:
+        registers = [qc.num_clbits]
+    meta = dict(meta, num_clbits=qc.num_clbits, registers=registers)
+    with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    size = _entry_size(tmp)
+    # Publish the entry atomically so a concurrent reader never sees half of
+    # it. If another process stored the same run first, keep its copy
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        return 0
+    return size
+
+
+def _entries(root):
+    for prefix in os.listdir(root):
+        bucket = os.path.join(root, prefix)
+        if os.path.isdir(bucket):
+            for name in os.listdir(bucket):
+                if not name.endswith('.tmp'):
+                    yield os.path.join(bucket, name)
+
+
+def _entry_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def evict(limit=None):
+    """Delete least recently used entries until the store fits in `limit` bytes."""
+    root = store_dir()
+    if root is None or not os.path.isdir(root):
+        return 0
+    limit = max_bytes if limit is None else limit
+    entries = [(os.path.getmtime(path), _entry_size(path), path) for path in _entries(root)]
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def _note_write(size):
+    """Account for `size` saved bytes and evict when enough have accumulated."""
+    global _unscanned_bytes
+    if _unscanned_bytes is not None:
+        _unscanned_bytes += size
+        if _unscanned_bytes < max_bytes // 8:
+            return
+    evict()
+    _unscanned_bytes = 0
+
+
+def run(qc, backend=None, shots=1024, seed=None, **options):
+    """Run one circuit, or load the stored result of an identical seeded run.
+
+    Returns a `StoredResult` for stored runs and the backend's Result
+    otherwise; both provide get_counts() and get_memory().
+    """
+    if backend is None:
+        backend = execution.get_backend()
+    root = store_dir()
+    if seed is None or root is None:
+        if seed is not None:
+            options['seed_simulator'] = seed
+        compiled = execution.transpile(qc, backend)
+        with trace.span('simulate', backend=backend.name, shots=shots):
+            return backend.run(compiled, shots=shots, memory=True, **options).result()
+
+    key = run_key(qc, backend, shots, seed, options)
+    path = os.path.join(root, key[:2], key)
+    if os.path.isdir(path):
+        os.utime(path)
+        trace.count('store.hits')
+        return StoredResult(path)
+
+    trace.count('store.misses')
+    compiled = execution.transpile(qc, backend)
+    with trace.span('simulate', backend=backend.name, shots=shots):
+        result = backend.run(compiled, shots=shots, memory=True, seed_simulator=seed,
+                             **options).result()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with trace.span('store.save', shots=shots):
+        size = _save(path, qc, result.get_memory(), {'backend': backend.name, 'shots': shots,
+                                                     'seed': seed})
+    _note_write(size)
+    return StoredResult(path) if os.path.isdir(path) else result
+
+
+def clear():
+    """Delete the whole store."""
+    root = store_dir()
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
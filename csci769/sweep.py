@@ -0,0 +1,125 @@
+"""Parallel (distance, rounds, p) sweeps of the repetition-code memory experiment.
+
+Each point builds `repetition_code_circuit(d, r)`, samples it with the
+Pauli-frame sampler under depolarizing noise of strength p on every gate,
+reset and measurement, decodes the syndrome history together with the
+final data bits and records the logical error rate. Points are spread
+over a process pool and every finished point is appended to one CSV
+table right away. Rerunning with the same output file skips the points
+that are already in it.
+
+Example:
+    python -m csci769.sweep --distances 3 25 --p-min 1e-3 --p-max 1e-1 --points 20
+"""
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from csci769 import repetition
+from csci769.pauli_frame import PauliFrameSampler, unpack
+
+FIELDS = ['distance', 'rounds', 'p', 'shots', 'errors', 'logical_error_rate', 'seconds']
+_CHUNK = 1 << 18
+
+
+def _point_seed(seed, distance, rounds, p):
+    return np.random.SeedSequence([seed, distance, rounds, int(round(p * 1e12))])
+
+
+def run_point(distance, rounds, p, shots, seed=0):
+    """Logical error rate of one (d, r, p) point."""
+    start = time.perf_counter()
+    qc = repetition.repetition_code_circuit(distance, rounds)
+    sampler = PauliFrameSampler(qc, p=p, p_measure=p, p_reset=p, seed=seed)
+    rng = np.random.default_rng(_point_seed(seed, distance, rounds, p))
+    errors = 0
+    for done in range(0, shots, _CHUNK):
+        chunk = min(_CHUNK, shots - done)
+        records = sampler.sample(chunk, rng)
+        data = unpack(records[:distance], chunk)
+        syndromes = unpack(records[distance:distance + rounds * (distance - 1)], chunk)
+        _, logical = repetition.decode(data, syndromes.reshape(chunk, rounds, distance - 1))
+        errors += int(logical.sum())
+    return {
+        'distance': distance,
+        'rounds': rounds,
+        'p': p,
+        'shots': shots,
+        'errors': errors,
+        'logical_error_rate': errors / shots,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _key(distance, rounds, p):
+    return int(distance), int(rounds), float(f'{float(p):.12g}')
+
+
+def load_table(path):
+    """Rows already written to a sweep CSV, keyed by (d, r, p)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, newline='') as f:
+        return {_key(row['distance'], row['rounds'], row['p']): row for row in csv.DictReader(f)}
+
+
+def sweep(distances, p_values, rounds=None, shots=10**5, output='sweep.csv',
+          max_workers=None, seed=0):
+    """Run every (d, r, p) point not yet present in `output`.
+
+    `rounds` is a list of round counts; None uses r = d for every distance.
+    Returns all rows of the table, including ones from earlier runs.
+    """
+    done = load_table(output)
+    points = []
+    for d in distances:
+        for r in (rounds if rounds is not None else [d]):
+            for p in p_values:
+                if _key(d, r, p) not in done:
+                    points.append((int(d), int(r), float(p)))
+
+    new_file = not os.path.exists(output)
+    with open(output, 'a', newline='') as f, \
+            ProcessPoolExecutor(max_workers=max_workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        # Largest circuits first so the pool does not end on a long straggler
+        points.sort(key=lambda point: point[0] * point[1], reverse=True)
+        futures = [pool.submit(run_point, d, r, p, shots, seed) for d, r, p in points]
+        for future in as_completed(futures):
+            row = future.result()
+            writer.writerow(row)
+            f.flush()
+            done[_key(row['distance'], row['rounds'], row['p'])] = row
+            print(f"d={row['distance']:<3} r={row['rounds']:<3} p={row['p']:.3e} "
+                  f"pL={row['logical_error_rate']:.3e} ({row['seconds']:.1f}s)")
+    return list(done.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--distances', type=int, nargs=2, default=[3, 25],
+                        help='smallest and largest odd distance')
+    parser.add_argument('--rounds', type=int, nargs='*',
+                        help='round counts to sweep (default: r = d)')
+    parser.add_argument('--p-min', type=float, default=1e-3)
+    parser.add_argument('--p-max', type=float, default=1e-1)
+    parser.add_argument('--points', type=int, default=20)
+    parser.add_argument('--shots', type=int, default=10**5)
+    parser.add_argument('--output', default='sweep.csv')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    distances = range(args.distances[0], args.distances[1] + 1, 2)
+    p_values = np.geomspace(args.p_min, args.p_max, args.points)
+    sweep(distances, p_values, args.rounds, args.shots, args.output, args.workers, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Parameterized circuit templates swept with one batched job.
+
+A template is an ordinary circuit with symbolic parameters. It is
+transpiled once (through `csci769.execution`), and all parameter values
+are bound by the simulator in a single run via `parameter_binds`, so a
+sweep of thousands of values costs one compilation and one job.
+
+`probability_matrix` returns the (parameter value x outcome) matrix of
+probabilities, with outcome j the integer whose bit k is clbit k. By
+default the probabilities are exact: the final measurements are replaced
+by a saved probability vector. With `shots` they are sampled instead.
+"""
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.circuit.library import PhaseGate, RYGate
+from qiskit_aer.library import SaveProbabilities
+
+from csci769 import execution, hhl, qpe, trace
+
+# Aer binds parameters natively only on single-qubit gates, so templates are
+# compiled to a basis in which every parameterized gate is one of those
+basis_gates = ['h', 'x', 'sx', 'p', 'rx', 'ry', 'rz', 'cx', 'swap', 'unitary', 'measure',
+               'save_probabilities']
+
+
+def qpe_template(n_count):
+    """QPE of a phase gate P(phi) on |1>, with phi symbolic. Returns (qc, phi)."""
+    phi = Parameter('phi')
+    qc = qpe.qpe_circuit(PhaseGate(phi), n_count, lambda qc, targets: qc.x(targets))
+    return qc, phi
+
+
+def hhl_template(A, b, n_clock, t=None):
+    """HHL for A x = b with symbolic eigenvalue-inversion angles.
+
+    The uniformly controlled RY of `hhl.hhl_circuit` is replaced by one
+    RY(theta[y]) per clock value y, controlled on the clock reading y, and
+    b and the ancilla are measured into registers 'x' and 'flag'. Binding
+    theta to `hhl.evolution(A, t).inversion_angles(n_clock)` gives the
+    standard circuit. Returns (qc, theta).
+    """
+    reference = hhl.hhl_circuit(A, b, n_clock, t)
+    clock, target, ancilla = reference.qregs
+    theta = ParameterVector('theta', 2 ** n_clock)
+    result_bits = ClassicalRegister(target.size, 'x')
+    flag = ClassicalRegister(1, 'flag')
+
+    qc = QuantumCircuit(clock, target, ancilla, result_bits, flag)
+    for instruction in reference.data:
+        if instruction.operation.name == 'ucry':
+            for y in range(2 ** n_clock):
+                qc.append(RYGate(theta[y]).control(n_clock, ctrl_state=y),
+                          list(clock) + [ancilla[0]])
+        else:
+            qc.append(instruction)
+    qc.measure(target, result_bits)
+    qc.measure(ancilla, flag)
+    return qc, theta
+
+
+def _measured_qubits(qc):
+    """Qubit indices measured into clbits 0..num_clbits-1."""
+    qubits = [None] * qc.num_clbits
+    for instruction in qc.data:
+        if instruction.operation.name == 'measure':
+            qubit = qc.find_bit(instruction.qubits[0]).index
+            qubits[qc.find_bit(instruction.clbits[0]).index] = qubit
+    if None in qubits:
+        raise ValueError("every clbit must be written by a measurement")
+    return qubits
+
+
+def _exact_template(qc):
+    qubits = _measured_qubits(qc)
+    exact = qc.remove_final_measurements(inplace=False)
+    exact.append(SaveProbabilities(len(qubits), label='probabilities'), qubits)
+    return exact
+
+
+def _run(backend, compiled, binds, num_values, **options):
+    with trace.span('simulate', backend=backend.name, parameter_values=num_values):
+        result = backend.run(compiled, parameter_binds=binds, **options).result()
+    if len(result.results) != num_values:
+        raise RuntimeError(f"simulator returned {len(result.results)} results for "
+                           f"{num_values} parameter values")
+    return result
+
+
+def probability_matrix(template, parameters, values, backend=None, shots=None, seed=None):
+    """(len(values), 2^num_clbits) outcome probabilities over a parameter sweep.
+
+    `parameters` is one Parameter or a sequence of them (e.g. a
+    ParameterVector); `values` has shape (num_values,) or
+    (num_values, num_parameters).
+    """
+    if isinstance(parameters, Parameter):
+        parameters = [parameters]
+    parameters = list(parameters)
+    values = np.asarray(values, dtype=float).reshape(len(values), -1)
+    if values.shape[1] != len(parameters):
+        raise ValueError(f"expected {len(parameters)} values per row, got {values.shape[1]}")
+    if backend is None:
+        backend = execution.get_backend()
+    binds = [{p: values[:, i].tolist() for i, p in enumerate(parameters)}]
+    num_outcomes = 2 ** template.num_clbits
+
+    if shots is None:
+        compiled = execution.transpile(_exact_template(template), backend, basis_gates=basis_gates)
+        result = _run(backend, compiled, binds, len(values), shots=1)
+        return np.array([result.data(i)['probabilities'] for i in range(len(values))])
+
+    compiled = execution.transpile(template, backend, basis_gates=basis_gates)
+    options = {} if seed is None else {'seed_simulator': seed}
+    result = _run(backend, compiled, binds, len(values), shots=shots, **options)
+    matrix = np.zeros((len(values), num_outcomes))
+    for i in range(len(values)):
+        for key, count in result.get_counts(i).items():
+            matrix[i, int(key.replace(' ', ''), 2)] = count / shots
+    return matrix
@@ -0,0 +1,151 @@
+"""Streaming version of the q1.py string encoder/decoder.
+
+Text or bytes of any length are cut into fixed-width blocks. Each block is
+q1's circuit (`text.create_circuit`) with a qubit per bit: X gates on
+|0...0> load the block's bits, and measure_all reads them out. That X-gate
+layer is the same as starting q1's circuit of the all-zero block in basis
+state |block>. So a batch of blocks runs through that one circuit in a
+single vectorized pass, and the measured bits are packed back into bytes
+with NumPy. The first block, and a short last block, are also run through
+their own q1 circuit, and a mismatch with the batched result raises
+RuntimeError. Only `max_in_flight` batches are alive at any time, so
+memory stays flat for large inputs.
+"""
+import codecs
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from csci769 import reversible
+from csci769.experiments import text
+
+_READ_SIZE = 1 << 16
+
+
+def _byte_chunks(data):
+    """Yield bytes from a str, bytes, binary/text file or iterable of pieces."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for start in range(0, len(view), _READ_SIZE):
+            yield bytes(view[start:start + _READ_SIZE])
+    elif isinstance(data, str):
+        for start in range(0, len(data), _READ_SIZE):
+            yield data[start:start + _READ_SIZE].encode('utf-8')
+    elif hasattr(data, 'read'):
+        while True:
+            piece = data.read(_READ_SIZE)
+            if not piece:
+                break
+            yield piece.encode('utf-8') if isinstance(piece, str) else piece
+    else:
+        for piece in data:
+            yield piece.encode('utf-8') if isinstance(piece, str) else bytes(piece)
+
+
+def iter_blocks(data, block_bytes=16):
+    """Regroup the input into blocks of `block_bytes` (the last may be short)."""
+    buffer = bytearray()
+    for chunk in _byte_chunks(data):
+        buffer += chunk
+        full = len(buffer) - len(buffer) % block_bytes
+        for start in range(0, full, block_bytes):
+            yield bytes(buffer[start:start + block_bytes])
+        del buffer[:full]
+    if buffer:
+        yield bytes(buffer)
+
+
+def block_circuit(block):
+    """q1's circuit for a block: an X gate on qubit i for every 1 bit, then measure_all."""
+    bits = np.unpackbits(np.frombuffer(block, dtype=np.uint8))
+    return text.create_circuit(''.join('1' if bit else '0' for bit in bits))
+
+
+class _BlockRunner:
+    """Simulates batches of equal-width blocks through one compiled circuit."""
+
+    def __init__(self, block_bytes):
+        self.block_bytes = block_bytes
+        self.circuit = block_circuit(bytes(block_bytes))
+        self.ops = reversible.compile_circuit(self.circuit)
+        self.checked = False
+
+    def __call__(self, blocks):
+        tail = b''
+        if len(blocks[-1]) != self.block_bytes:
+            tail = _run_block(blocks[-1])
+            blocks = blocks[:-1]
+        if not blocks:
+            return tail
+        data = np.frombuffer(b''.join(blocks), dtype=np.uint8)
+        inputs = np.unpackbits(data.reshape(len(blocks), self.block_bytes), axis=1)
+        _, measured = reversible.simulate_batch(self.circuit, inputs, self.ops)
+        # measure_all's register follows the circuit's own 8 * block_bytes clbits
+        decoded = np.packbits(measured[:, inputs.shape[1]:], axis=1).tobytes()
+        if not self.checked:
+            # Building a q1 circuit costs about 2 ms, so only the first block is checked
+            if decoded[:self.block_bytes] != _run_block(blocks[0]):
+                raise RuntimeError(f"block {blocks[0]!r} decoded differently from its q1 circuit")
+            self.checked = True
+        return decoded + tail
+
+
+def _run_block(block):
+    qc = block_circuit(block)
+    _, value = reversible.simulate(qc)
+    value >>= 8 * len(block)
+    raw = np.frombuffer(value.to_bytes(len(block), 'little'), dtype=np.uint8)
+    return np.packbits(np.unpackbits(raw, bitorder='little')).tobytes()
+
+
+def _batches(blocks, size):
+    batch = []
+    for block in blocks:
+        batch.append(block)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_roundtrip(data, block_bytes=16, blocks_per_batch=1024, max_in_flight=4,
+                     errors='replace'):
+    """Encode, simulate and decode `data`, yielding decoded text incrementally.
+
+    Blocks are grouped into batches of `blocks_per_batch` and at most
+    `max_in_flight` batches are queued on the worker pool at once.
+    Multi-byte UTF-8 characters split across blocks are reassembled by an
+    incremental decoder.
+    """
+    runner = _BlockRunner(block_bytes)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors=errors)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for batch in _batches(iter_blocks(data, block_bytes), blocks_per_batch):
+            pending.append(pool.submit(runner, batch))
+            if len(pending) >= max_in_flight:
+                text = decoder.decode(pending.popleft().result())
+                if text:
+                    yield text
+        while pending:
+            text = decoder.decode(pending.popleft().result())
+            if text:
+                yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def throughput(n_bytes=1 << 20, **options):
+    """Round-trip `n_bytes` of random printable text and return MB/s."""
+    rng = np.random.default_rng(0)
+    payload = rng.integers(32, 127, n_bytes, dtype=np.uint8).tobytes()
+    start = time.perf_counter()
+    decoded = sum(len(piece) for piece in stream_roundtrip(payload, **options))
+    elapsed = time.perf_counter() - start
+    if decoded != n_bytes:
+        raise RuntimeError(f"decoded {decoded} of {n_bytes} bytes")
+    return n_bytes / elapsed / 1e6
@@ -0,0 +1,63 @@
+"""Fit the threshold model pL = A * (p / pth) ** ((d + 1) / 2) to simulated data.
+
+Repetition-code memory experiments are run over a (d, p) grid in a process
+pool (see `csci769.sweep`). A and pth are then fitted by weighted linear
+least squares on log pL. With k = (d + 1) / 2 the model is linear:
+
+    log pL - k log p = log A - k log pth
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from csci769.sweep import run_point
+
+
+def simulate_grid(distances, p_values, shots=10**5, rounds=3, max_workers=None, seed=0):
+    """Run every (d, p) point in parallel and return columnar arrays.
+
+    `rounds` is a fixed round count, or None for r = d.
+    """
+    points = [(int(d), int(d if rounds is None else rounds), float(p))
+              for d in distances for p in p_values]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run_point, d, r, p, shots, seed) for d, r, p in points]
+        rows = [future.result() for future in futures]
+    return {
+        'distance': np.array([row['distance'] for row in rows]),
+        'p': np.array([row['p'] for row in rows]),
+        'errors': np.array([row['errors'] for row in rows]),
+        'shots': np.array([row['shots'] for row in rows]),
+    }
+
+
+def fit_threshold(distance, p, errors, shots, min_errors=10, max_rate=0.25):
+    """Weighted least-squares fit of (A, pth).
+
+    Only points with at least `min_errors` logical errors (so log pL is
+    well defined and not dominated by shot noise) and pL below `max_rate`
+    (the sub-threshold regime the model describes) are used. Each row is
+    weighted by sqrt(errors), the inverse of its relative standard error.
+    """
+    distance, p = np.asarray(distance, dtype=float), np.asarray(p, dtype=float)
+    errors, shots = np.asarray(errors, dtype=float), np.asarray(shots, dtype=float)
+    pL = errors / shots
+    use = (errors >= min_errors) & (pL < max_rate)
+    if use.sum() < 2:
+        raise ValueError("not enough points with logical errors to fit the threshold")
+
+    k = (distance[use] + 1) / 2
+    y = np.log(pL[use]) - k * np.log(p[use])
+    X = np.column_stack([np.ones_like(k), -k])
+    w = np.sqrt(errors[use])
+    (log_A, log_pth), *_ = np.linalg.lstsq(X * w[:, None], y * w, rcond=None)
+    return float(np.exp(log_A)), float(np.exp(log_pth))
+
+
+def estimate_parameters(distances=(3, 5, 7, 9), p_values=None, shots=10**5, rounds=3,
+                        max_workers=None, seed=0):
+    """Simulate the grid and return the fitted (A, pth)."""
+    if p_values is None:
+        p_values = np.geomspace(2e-3, 6e-2, 10)
+    grid = simulate_grid(distances, p_values, shots, rounds, max_workers, seed)
+    return fit_threshold(grid['distance'], grid['p'], grid['errors'], grid['shots'])
@@ -0,0 +1,185 @@
+"""Opt-in stage spans and counters, exportable as a Chrome trace.
+
+Tracing is off by default. Setting $CSCI769_TRACE to a file name, or calling
+`enable(path)`, switches it on for the process and writes the trace there
+at exit. It opens in chrome://tracing or https://ui.perfetto.dev.
+
+    with trace.span('build') as s:
+        qc = build_circuit()
+        s.circuit(qc)
+
+A span records wall time, process CPU time (including Aer's threads) and
+the peak RSS of the process when it ends. `circuit(qc)` adds the width,
+depth, size and gate counts of a circuit to its arguments. `count` adds to
+a named counter, emitted as a Chrome counter event.
+
+While disabled, `span` returns one shared no-op object and `count` returns
+immediately, so instrumented code pays a function call and a flag test.
+"""
+import atexit
+import functools
+import json
+import os
+import resource
+import sys
+import threading
+import time
+
+enabled = False
+_path = None
+_events = []
+_counters = {}
+_origin = time.perf_counter_ns()
+
+
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def circuit_args(qc):
+    """Width, depth, size and gate counts of a circuit."""
+    return {
+        'width': qc.num_qubits,
+        'clbits': qc.num_clbits,
+        'depth': qc.depth(),
+        'size': qc.size(),
+        'gates': dict(qc.count_ops()),
+    }
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start', 'cpu')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def circuit(self, qc):
+        """Record the metrics of `qc` on this span and return it."""
+        self.args.update(circuit_args(qc))
+        return qc
+
+    def __enter__(self):
+        self.cpu = time.process_time_ns()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        cpu = time.process_time_ns() - self.cpu
+        args = dict(self.args, cpu_ms=cpu / 1e6, peak_rss_bytes=_peak_rss_bytes())
+        if exc_type is not None:
+            args['error'] = exc_type.__name__
+        _events.append({
+            'name': self.name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+            'ts': (self.start - _origin) / 1e3, 'dur': (end - self.start) / 1e3, 'args': args,
+        })
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def circuit(self, qc):
+        return qc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL = _NullSpan()
+
+
+def span(name, **args):
+    """Context manager timing one stage; a shared no-op while disabled."""
+    if not enabled:
+        return _NULL
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """Decorator running the function inside a span (its qualified name by default)."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, value=1):
+    """Add `value` to counter `name`."""
+    if not enabled:
+        return
+    total = _counters[name] = _counters.get(name, 0) + value
+    _events.append({
+        'name': name, 'ph': 'C', 'pid': os.getpid(), 'tid': threading.get_ident(),
+        'ts': (time.perf_counter_ns() - _origin) / 1e3, 'args': {name: total},
+    })
+
+
+def counters():
+    return dict(_counters)
+
+
+def chrome_trace():
+    """The recorded events in Chrome trace-event format."""
+    return {'traceEvents': list(_events), 'displayTimeUnit': 'ms'}
+
+
+def export_chrome(path=None):
+    """Write the trace as JSON to `path` (default: the path given to `enable`)."""
+    path = path or _path
+    with open(path, 'w') as f:
+        json.dump(chrome_trace(), f)
+    return path
+
+
+def summary():
+    """Calls, wall seconds and CPU seconds per span name, slowest first."""
+    totals = {}
+    for event in _events:
+        if event['ph'] != 'X':
+            continue
+        row = totals.setdefault(event['name'], {'calls': 0, 'seconds': 0.0, 'cpu_seconds': 0.0})
+        row['calls'] += 1
+        row['seconds'] += event['dur'] / 1e6
+        row['cpu_seconds'] += event['args']['cpu_ms'] / 1e3
+    return dict(sorted(totals.items(), key=lambda item: -item[1]['seconds']))
+
+
+def reset():
+    _events.clear()
+    _counters.clear()
+
+
+def _export_at_exit():
+    if enabled and _path and _events:
+        export_chrome()
+
+
+def enable(path=None):
+    """Start recording; if `path` is given the trace is written there at exit."""
+    global enabled, _path
+    enabled = True
+    if path is not None:
+        _path = path
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+atexit.register(_export_at_exit)
+if os.environ.get('CSCI769_TRACE'):
+    enable(os.environ['CSCI769_TRACE'])